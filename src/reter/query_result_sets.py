@@ -9,6 +9,11 @@ Contains wrapper classes for query results from the C++ RETE network:
 - LiveQueryResultSet: Auto-updating query results
 """
 
+import functools
+import itertools
+import operator
+import sys
+
 # Import C++ RETE implementation from reter_core
 try:
     from reter_core import owl_rete_cpp
@@ -18,6 +23,56 @@ except ImportError as e:
         "Please ensure reter_core is installed: pip install reter_core"
     ) from e
 
+# Optional dataframe dependencies, resolved once at import time
+try:
+    import pyarrow as _pa
+except ImportError:
+    _pa = None
+
+try:
+    import pandas as _pd
+except ImportError:
+    _pd = None
+
+
+@functools.lru_cache(maxsize=256)
+def _interned_row_keys(variables):
+    """Interned row keys for a tuple of variable names, built once per tuple"""
+    return tuple(sys.intern(var) for var in variables)
+
+
+@functools.lru_cache(maxsize=256)
+def _row_projector(variables):
+    """
+    Build a bindings -> row dict function for a tuple of variable names
+
+    The function is generated once per variable tuple so each row is a single
+    dict display instead of dict(zip(...)) over a map. Variable names are only
+    referenced through generated identifiers (_k0, _k1, ...), never spliced
+    into the source.
+    """
+    names = {f"_k{i}": var for i, var in enumerate(variables)}
+    items = ", ".join(f"{name}: get({name})" for name in names)
+    source = f"def project(bindings):\n    get = bindings.get\n    return {{{items}}}\n"
+    namespace = {}
+    exec(compile(source, "<row-projector>", "exec"), names, namespace)
+    return namespace["project"]
+
+
+@functools.lru_cache(maxsize=1024)
+def _pattern_vars(pattern):
+    """Extract variable names from a (hashable) triple pattern"""
+    return frozenset(elem for elem in pattern if isinstance(elem, str) and elem.startswith("?"))
+
+
+def _arrow_types_mapper(use_arrow_dtypes):
+    """Return the Table.to_pandas types_mapper for use_arrow_dtypes (or None)"""
+    if not use_arrow_dtypes:
+        return None
+    if not hasattr(_pd, "ArrowDtype"):
+        raise ImportError("use_arrow_dtypes=True requires pandas >= 2.0")
+    return _pd.ArrowDtype
+
 
 class QueryResultSet:
     """
@@ -49,40 +104,55 @@ class QueryResultSet:
         self._network = network
         self._arrow_table = None  # For Week 2
         self._tokens = tokens  # NEW: Cache for template queries (Week 3)
+        self._extractor = None  # token -> bindings callable, resolved on first use
+        # Interned row keys, built once (None means "yield raw bindings")
+        self._row_keys = _interned_row_keys(tuple(variables)) if variables else None
+
+    def _get_tokens(self):
+        """Return pre-fetched tokens, or fetch the production's current tokens"""
+        if self._tokens is not None:
+            return self._tokens
+        return self._network.get_query_results(self._production)
+
+    def _binding_extractor(self):
+        """Return a token -> bindings callable, resolved once per result set"""
+        if self._extractor is None:
+            # Get cache key for binding extraction
+            # For template queries, _production is already the cache key string
+            if isinstance(self._production, str):
+                cache_key = self._production
+            else:
+                cache_key = self._production.cache_key()
+            self._extractor = functools.partial(self._network.extract_bindings, cache_key)
+        return self._extractor
 
     def __iter__(self):
         """Iterate over result bindings (zero-copy)"""
         # Use cached tokens if available (template queries), otherwise fetch from production
-        if self._tokens is not None:
-            tokens = self._tokens
-        else:
-            tokens = self._network.get_query_results(self._production)
+        return self._iter_rows(self._get_tokens())
 
-        # Get cache key for binding extraction
-        # For template queries, _production is already the cache key string
-        if isinstance(self._production, str):
-            cache_key = self._production
-        else:
-            cache_key = self._production.cache_key()
+    def _iter_rows(self, tokens):
+        """Yield result bindings for the given tokens"""
+        # Resolve the projection and the extractor once instead of per row
+        project = _row_projector(self._row_keys) if self._row_keys else None
+        extract = self._binding_extractor()
 
         for token in tokens:
             # Extract bindings using cache key (fast path via cached field indices)
-            bindings = self._network.extract_bindings(cache_key, token)
+            bindings = extract(token)
 
             # Return only requested variables (if specified)
-            if self._variables:
-                yield {v: bindings.get(v, None) for v in self._variables}
-            else:
+            if project is None:
                 yield bindings
+            else:
+                yield project(bindings)
 
     def __len__(self):
         """Number of results (requires iteration or Arrow table)"""
-        if self._tokens is not None:
-            return len(self._tokens)
         # For template queries, _production is a string (cache key), not a production object
-        if isinstance(self._production, str):
-            # No production object, must count via iteration
-            return sum(1 for _ in self)
+        if self._tokens is not None or isinstance(self._production, str):
+            # Count tokens directly; no need to extract bindings
+            return len(self._get_tokens())
         return self._production.get_token_count()
 
     def __getitem__(self, key):
@@ -92,25 +162,57 @@ class QueryResultSet:
         - results[-1]: Last result
         - results[5:10]: Slice of results
         """
+        # "First K" style slices (non-negative bounds, forward step) only need
+        # bindings for the selected tokens, not the whole Arrow table
+        if (
+            isinstance(key, slice)
+            and self._arrow_table is None
+            and self._variables
+            and (key.start is None or key.start >= 0)
+            and key.stop is not None
+            and key.stop >= 0
+            and (key.step is None or key.step > 0)
+        ):
+            tokens = itertools.islice(self._get_tokens(), key.start, key.stop, key.step)
+            return list(self._iter_rows(tokens))
+
+        # Single element before materialization: extract just that token
+        if not isinstance(key, slice) and self._arrow_table is None and self._variables:
+            key = operator.index(key)
+            tokens = self._get_tokens()
+            num_rows = len(tokens)
+            index = key + num_rows if key < 0 else key
+            if index < 0 or index >= num_rows:
+                raise IndexError(f"Index {index} out of range")
+            return next(self._iter_rows((tokens[index],)))
+
         # Materialize if not already done
         if self._arrow_table is None:
             self._materialize()
 
+        num_rows = self._arrow_table.num_rows
+
         # Handle slicing
         if isinstance(key, slice):
-            # Convert PyArrow table slice to list of dicts
-            sliced = self._arrow_table.slice(
-                key.start or 0,
-                key.stop - (key.start or 0) if key.stop else None
-            )
+            # Normalize negative/omitted bounds the same way list slicing does
+            start, stop, step = key.indices(num_rows)
+            if step == 1:
+                # Contiguous range: zero-copy Arrow slice
+                sliced = self._arrow_table.slice(start, max(stop - start, 0))
+            else:
+                # Strided or reversed range: gather rows with Arrow's take kernel
+                indices = _pa.array(range(start, stop, step), type=_pa.int64())
+                sliced = self._arrow_table.take(indices)
             return sliced.to_pylist()
 
+        key = operator.index(key)
+
         # Handle negative index
         if key < 0:
-            key = len(self) + key
+            key = num_rows + key
 
         # Single element access
-        if key < 0 or key >= len(self):
+        if key < 0 or key >= num_rows:
             raise IndexError(f"Index {key} out of range")
 
         row = self._arrow_table.slice(key, 1)
@@ -142,43 +244,101 @@ class QueryResultSet:
         Returns:
             pyarrow.Table: Arrow table with results
         """
-        try:
-            import pyarrow as pa
-        except ImportError:
+        if _pa is None:
             raise ImportError("pyarrow is required for to_arrow(). Install with: pip install pyarrow")
 
         # For template queries with cached tokens, build Arrow table from iteration
         if self._tokens is not None or isinstance(self._production, str):
-            # Build Arrow table from Python iteration
-            results = list(self)
-            if not results:
-                # Empty table with correct schema
-                return pa.table({var: [] for var in self._variables})
-            # Convert list of dicts to columnar format
-            columns = {var: [r.get(var) for r in results] for var in self._variables}
-            return pa.table(columns)
+            # Fill one list per column in a single pass over the rows
+            # (empty lists still give an empty table with the right columns)
+            columns = {var: [] for var in self._variables}
+            appends = [(columns[var].append, var) for var in self._variables]
+            for row in self:
+                for append, var in appends:
+                    append(row.get(var))
+            return _pa.table(columns)
 
         # Use C++ vectorized to_arrow method for regular queries
         return self._network.query_to_arrow(self._production, self._variables)
 
-    def to_pandas(self):
+    def iter_batches(self, batch_size=4096):
+        """
+        Iterate over results as Arrow RecordBatches of at most batch_size rows
+
+        Keeps the Python-side working set bounded: rows are converted one
+        batch at a time instead of building one list per column for the
+        whole result. Every batch shares one schema, inferred from all rows
+        up front, so a batch whose values for a column are all None is not
+        typed differently from the rest.
+
+        Args:
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            pyarrow.RecordBatch: Batches with one column per variable
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if _pa is None:
+            raise ImportError("pyarrow is required for iter_batches(). Install with: pip install pyarrow")
+        if self._variables is None:
+            raise ValueError("iter_batches() needs the result's variables; use to_list() for raw bindings")
+
+        variables = self._variables
+        # Fetch once so the schema pass and the batches see the same tokens
+        tokens = self._get_tokens()
+        schema = self._batch_schema(self._iter_rows(tokens))
+        rows = self._iter_rows(tokens)
+        while True:
+            chunk = list(itertools.islice(rows, batch_size))
+            if not chunk:
+                return
+            yield _pa.RecordBatch.from_pydict(
+                {var: [row.get(var) for row in chunk] for var in variables}, schema=schema
+            )
+
+    def _batch_schema(self, rows):
+        """Arrow schema for iter_batches(), promoting each column's type across all rows"""
+        # One sample value per Python type and column; Arrow promotes them
+        samples = {var: {} for var in self._variables}
+        for row in rows:
+            for var, column in samples.items():
+                value = row.get(var)
+                if value is not None:
+                    column.setdefault(type(value), value)
+        return _pa.schema([
+            (var, _pa.infer_type(list(column.values())) if column else _pa.null())
+            for var, column in samples.items()
+        ])
+
+    def to_pandas(self, use_arrow_dtypes=False):
         """
         Convert to pandas DataFrame (Week 2, Day 1-5)
         Now uses Arrow Table as intermediate for efficiency.
 
+        Args:
+            use_arrow_dtypes: Keep columns as pyarrow-backed pandas dtypes
+                (pd.ArrowDtype, pandas >= 2.0) instead of converting strings
+                to object columns. Avoids a copy per column on large results.
+
         Returns:
             pandas.DataFrame: DataFrame with query results
         """
-        try:
-            import pandas as pd
-        except ImportError:
+        if _pd is None:
             raise ImportError("pandas is required for to_pandas(). Install with: pip install pandas")
 
         # Use Arrow Table for efficient conversion
         arrow_table = self.to_arrow()
 
-        # Zero-copy conversion where possible
-        df = arrow_table.to_pandas()
+        # Zero-copy conversion where possible. The table is private to this call,
+        # so let pandas keep one block per column and release Arrow buffers as
+        # each column is converted instead of holding both copies at peak.
+        df = arrow_table.to_pandas(
+            split_blocks=True,
+            self_destruct=True,
+            types_mapper=_arrow_types_mapper(use_arrow_dtypes),
+        )
+        del arrow_table  # unusable after self_destruct
 
         # Ensure columns are in the order of variables (if specified)
         if self._variables:
@@ -234,16 +394,11 @@ class FilteredQueryResultSet:
             else:
                 raise RuntimeError("Could not extract production from NOT EXISTS pattern")
 
-        # Extract all variables from NOT EXISTS patterns
-        def get_vars(pattern):
-            """Extract variable names from a pattern"""
-            return {elem for elem in pattern if isinstance(elem, str) and elem.startswith("?")}
-
         # Collect all variables that appear in both main query and NOT EXISTS patterns
         main_vars = set(variables)
-        not_exists_vars = set()
-        for pattern in not_exists_patterns:
-            not_exists_vars.update(get_vars(pattern))
+        not_exists_vars = frozenset().union(
+            *(_pattern_vars(tuple(pattern)) for pattern in not_exists_patterns)
+        )
 
         # Shared variables are those in both main and NOT EXISTS
         shared_vars = sorted(main_vars & not_exists_vars)
@@ -281,19 +436,24 @@ class UnionQueryResultSet:
         """
         # Extract productions and variables from queries
         # Works with both old Python QueryResultSet and new C++ QueryResultSet (both have _production now)
-        productions = []
-        all_variables = set()
+        members = []
 
         for query in queries:
-            if hasattr(query, '_production') and query._production:
-                productions.append(query._production)
-            if hasattr(query, '_variables') and query._variables:
-                all_variables.update(query._variables)
-
+            # EAFP: result sets always carry both attributes, so skip the
+            # per-query hasattr() probes and only handle the odd one out
+            try:
+                members.append((query._production, query._variables))
+            except AttributeError:
+                continue
+
+        productions = [production for production, _ in members if production]
         if not productions:
             raise ValueError("UnionQueryResultSet requires at least one query with a production")
 
-        variables = sorted(all_variables)
+        # Union of all variable lists in one C-level pass
+        variables = sorted(set(itertools.chain.from_iterable(
+            query_variables or () for _, query_variables in members
+        )))
 
         # Use C++ union_query - returns C++ QueryResultSet directly
         return network.union_query(productions, variables)
@@ -304,6 +464,10 @@ class PropertyPathResultSet:
     Query result set for property paths (Week 5, Day 6-7)
     Computes transitive closure of a property using BFS
 
+    The closure is computed on first access and reused until the reasoner
+    changes (see Reter._generation()), so len(), iteration and conversions
+    share one BFS. Rows handed to callers are copies of the cached ones.
+
     ::: This is-in-layer Core-Layer.
     ::: This is a query-executor.
     ::: This is-in-process Main-Process.
@@ -320,103 +484,126 @@ class PropertyPathResultSet:
             reasoner: Reter instance
         """
         self._subject = subject
+        self._subject_is_var = subject.startswith("?")  # checked per emitted row
         self._property = property_name
         self._object_var = object_var
         self._max_depth = max_depth
         self._reasoner = reasoner
+        self._closure = None  # Cached transitive closure (computed lazily)
+        self._closure_generation = None  # Reasoner generation when _closure was computed
+
+    def _closure_cached(self):
+        """Compute the transitive closure once per reasoner generation and reuse it"""
+        generation = self._reasoner._generation()
+        if self._closure is None or generation != self._closure_generation:
+            self._closure = self._compute_transitive_closure()
+            self._closure_generation = generation
+        return self._closure
 
     def _compute_transitive_closure(self):
         """Compute transitive closure using BFS"""
         results = []
 
-        # If subject is a variable, get all starting points
-        if self._subject.startswith("?"):
-            # Get all individuals that have this property
-            start_query = self._reasoner.pattern((self._subject, self._property, "?_obj"))
-            start_nodes = {r[self._subject] for r in start_query.to_list()}
+        # Fetch every edge of the property with a single query and index it
+        # by source node, instead of issuing one query per visited node
+        successors = {}
+        for edge in self._reasoner.pattern(("?_s", self._property, "?_o")):
+            successors.setdefault(edge["?_s"], []).append(edge["?_o"])
+
+        # If subject is a variable, start from every individual that has this property
+        if self._subject_is_var:
+            start_nodes = successors.keys()
         else:
-            start_nodes = {self._subject}
+            start_nodes = (self._subject,)
+
+        subject, object_var, subject_is_var = self._subject, self._object_var, self._subject_is_var
 
-        # For each starting node, perform BFS
+        # For each starting node, expand the reachable set one depth level at a time.
+        # Frontiers are insertion-ordered dicts rather than sets, so rows come out
+        # in the same BFS order in every process (sets follow string hashing).
         for start_node in start_nodes:
             visited = set()
-            queue = [(start_node, 0)]  # (node, depth)
-
-            while queue:
-                current, depth = queue.pop(0)
-
-                # Skip if already visited or max depth reached
-                if current in visited or depth >= self._max_depth:
-                    continue
-
-                visited.add(current)
-
-                # Query for direct successors via this property
-                successor_query = self._reasoner.pattern((current, self._property, "?next"))
-                successors = successor_query.to_list()
-
-                for s in successors:
-                    next_node = s["?next"]
-
-                    # Add to results (excluding start node itself unless reflexive)
-                    if next_node != start_node or depth > 0:
-                        result = {}
-                        if self._subject.startswith("?"):
-                            result[self._subject] = start_node
-                        result[self._object_var] = next_node
-
-                        # Check if we already have this result
-                        if result not in results:
-                            results.append(result)
-
-                    # Add to queue for further exploration
-                    if next_node not in visited and depth + 1 < self._max_depth:
-                        queue.append((next_node, depth + 1))
+            emitted = set()  # next nodes already reported for this start node
+            frontier = {start_node: None}
+
+            for depth in range(self._max_depth):
+                visited.update(frontier)
+                next_frontier = {}
+
+                for current in frontier:
+                    for next_node in successors.get(current, ()):
+                        # Add to results (excluding start node itself unless reflexive)
+                        if (next_node != start_node or depth > 0) and next_node not in emitted:
+                            emitted.add(next_node)
+                            if subject_is_var:
+                                results.append({subject: start_node, object_var: next_node})
+                            else:
+                                results.append({object_var: next_node})
+
+                        # Expand unvisited nodes on the next level
+                        if next_node not in visited:
+                            next_frontier[next_node] = None
+
+                if not next_frontier:
+                    break
+                frontier = next_frontier
 
         return results
 
     def __iter__(self):
         """Iterate over transitive closure results"""
-        for result in self._compute_transitive_closure():
-            yield result
+        # Copies, so a caller editing a row cannot change the cached closure
+        return map(dict, self._closure_cached())
 
     def __len__(self):
         """Number of reachable nodes"""
-        return len(self._compute_transitive_closure())
+        return len(self._closure_cached())
 
     def __repr__(self):
         return f"PropertyPathResultSet({len(self)} reachable nodes, max_depth={self._max_depth})"
 
     def to_list(self):
-        """Convert to list of dicts"""
-        return self._compute_transitive_closure()
+        """Convert to list of dicts (copies of the cached rows)"""
+        return list(map(dict, self._closure_cached()))
 
-    def to_pandas(self):
+    def to_arrow(self):
         """
-        Convert property path results to pandas DataFrame
+        Convert property path results to PyArrow Table
 
         Returns:
-            pandas.DataFrame with columns for subject and object
+            pyarrow.Table with columns for subject (if a variable) and object
         """
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError("pandas is required for to_pandas(). Install with: pip install pandas")
+        if _pa is None:
+            raise ImportError("pyarrow is required for to_arrow(). Install with: pip install pyarrow")
 
-        # Get transitive closure results
-        data = self.to_list()
+        closure = self._closure_cached()
+        columns = {}
+        if self._subject_is_var:
+            columns[self._subject] = [row[self._subject] for row in closure]
+        columns[self._object_var] = [row[self._object_var] for row in closure]
+        return _pa.table(columns)
 
-        # If no results, return empty DataFrame
-        if not data:
-            columns = [self._object_var]
-            if self._subject.startswith("?"):
-                columns.insert(0, self._subject)
-            return pd.DataFrame(columns=columns)
+    def to_pandas(self, use_arrow_dtypes=False):
+        """
+        Convert property path results to pandas DataFrame
 
-        # Create DataFrame from list of dicts
-        df = pd.DataFrame(data)
+        Args:
+            use_arrow_dtypes: Keep columns as pyarrow-backed pandas dtypes
+                (pd.ArrowDtype, pandas >= 2.0)
 
-        return df
+        Returns:
+            pandas.DataFrame with columns for subject and object
+        """
+        if _pd is None:
+            raise ImportError("pandas is required for to_pandas(). Install with: pip install pandas")
+
+        # Build the columns once in Arrow, then hand the private table to pandas
+        arrow_table = self.to_arrow()
+        return arrow_table.to_pandas(
+            split_blocks=True,
+            self_destruct=True,
+            types_mapper=_arrow_types_mapper(use_arrow_dtypes),
+        )
 
 
 class LiveQueryResultSet:
@@ -439,6 +626,9 @@ class LiveQueryResultSet:
         self._variables = variables
         self._network = network
         self._callbacks = []
+        self._extractor = None  # token -> bindings callable, resolved on first use
+        # Interned row keys, built once (None means "yield raw bindings")
+        self._row_keys = _interned_row_keys(tuple(variables)) if variables else None
 
     def __len__(self):
         """Number of current results"""
@@ -447,17 +637,26 @@ class LiveQueryResultSet:
     def __iter__(self):
         """Iterate over current results"""
         tokens = self._live_query.get_results()
-        cache_key = self._live_query.cache_key()
+
+        # The live query's cache key never changes, so bind it once
+        if self._extractor is None:
+            self._extractor = functools.partial(
+                self._network.extract_bindings, self._live_query.cache_key()
+            )
+
+        # Resolve the projection and the extractor once instead of per row
+        project = _row_projector(self._row_keys) if self._row_keys else None
+        extract = self._extractor
 
         for token in tokens:
             # Extract bindings from token using cache_key
-            bindings = self._network.extract_bindings(cache_key, token)
+            bindings = extract(token)
 
             # Return only requested variables
-            if self._variables:
-                yield {v: bindings.get(v, None) for v in self._variables}
-            else:
+            if project is None:
                 yield bindings
+            else:
+                yield project(bindings)
 
     def __repr__(self):
         return f"LiveQueryResultSet({len(self)} results, variables={self._variables})"
@@ -486,22 +685,36 @@ class LiveQueryResultSet:
         """Snapshot of current results as list"""
         return list(self)
 
-    def to_pandas(self):
-        """Snapshot of current results as pandas DataFrame"""
-        try:
-            import pandas as pd
-        except ImportError:
+    def to_pandas(self, use_arrow_dtypes=False):
+        """
+        Snapshot of current results as pandas DataFrame
+
+        Args:
+            use_arrow_dtypes: Build the snapshot through Arrow and keep
+                pyarrow-backed pandas dtypes (pd.ArrowDtype, pandas >= 2.0)
+        """
+        if _pd is None:
             raise ImportError("pandas is required for to_pandas()")
 
         # Get current data
         data = self.to_list()
 
+        if use_arrow_dtypes:
+            if _pa is None:
+                raise ImportError("pyarrow is required for use_arrow_dtypes=True. Install with: pip install pyarrow")
+            types_mapper = _arrow_types_mapper(use_arrow_dtypes)
+            if self._variables:
+                arrow_table = _pa.table({var: [row.get(var) for row in data] for var in self._variables})
+            else:
+                arrow_table = _pa.Table.from_pylist(data)
+            return arrow_table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=types_mapper)
+
         # If no results, return empty DataFrame with columns
         if not data:
-            return pd.DataFrame(columns=self._variables if self._variables else [])
+            return _pd.DataFrame(columns=self._variables if self._variables else [])
 
         # Create DataFrame from list of dicts
-        df = pd.DataFrame(data)
+        df = _pd.DataFrame(data)
 
         # Ensure columns are in the order of variables (if specified)
         if self._variables:
@@ -3,12 +3,20 @@ Description Logic Reasoner using C++ OWL RETE with C++ DL Parser
 Simplified reasoner that uses C++ parser directly - NO Python Lark dependency!
 """
 
+import functools
+import hashlib
+import itertools
+import json
+import operator
 import os
+import pickle
 import sys
+import tempfile
 
 # Import pyarrow first to ensure Arrow DLLs are available (required for Arrow integration on Windows)
 try:
     import pyarrow
+    import pyarrow.compute as pc
 except ImportError:
     pass  # Arrow support optional
 
@@ -43,6 +51,416 @@ __all__ = [
     "LiveQueryResultSet",
 ]
 
+# Path separators (either style) -> "." in a single str.translate pass
+_MODULE_NAME_TABLE = str.maketrans({"/": ".", "\\": "."})
+
+
+def _module_name_from_path(path):
+    """Derive a dotted module name from a relative Python file path"""
+    if path.endswith(".py"):
+        path = path[:-3]
+    return path.translate(_MODULE_NAME_TABLE)
+
+
+# Directories the directory loaders never descend into: caches, VCS metadata
+# and installed third-party environments
+_SKIP_DIRS = frozenset({"__pycache__", ".git", "node_modules", ".venv", "venv", ".tox"})
+
+# Filename suffixes picked up by each directory loader. Kept as tuples:
+# str.endswith() over a tuple is a single C call, cheaper per entry than
+# splitting off the extension for a set lookup.
+_CSHARP_SUFFIXES = (".cs",)
+_CPP_SUFFIXES = (".cpp", ".cc", ".cxx", ".h", ".hpp", ".hxx")
+_JAVASCRIPT_SUFFIXES = (".js", ".jsx", ".mjs")
+_HTML_SUFFIXES = (".html", ".htm")
+
+
+def _iter_source_files(root, suffixes, recursive=True, skip_dirs=_SKIP_DIRS, skip_hidden=False,
+                       follow_symlinks=False):
+    """
+    Yield paths of files under root whose names end with one of suffixes
+
+    Walks depth-first with os.scandir and an explicit stack (same order as
+    os.walk), using the cached DirEntry type instead of a stat() per entry.
+    Directories named in skip_dirs are pruned, so they are never listed.
+
+    Args:
+        root: Directory to scan
+        suffixes: Filename suffix or tuple of suffixes (e.g. (".cpp", ".h"))
+        recursive: If False, only scan root itself
+        skip_dirs: Directory names to prune
+        skip_hidden: Also skip files and directories whose names start with "."
+        follow_symlinks: Also descend into symlinked directories, like a
+            recursive glob. Each directory is scanned once (tracked by
+            device and inode), so symlink cycles terminate.
+    """
+    stack = [root]
+    visited = set()
+    while stack:
+        directory = stack.pop()
+        if follow_symlinks:
+            try:
+                st = os.stat(directory)
+            except OSError:
+                continue
+            if (st.st_dev, st.st_ino) in visited:
+                continue  # Already scanned through another path (or a cycle)
+            visited.add((st.st_dev, st.st_ino))
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if skip_hidden and name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        if recursive and name not in skip_dirs:
+                            subdirs.append(entry.path)
+                    elif name.endswith(suffixes) and entry.is_file():
+                        files.append(entry.path)
+        except OSError:
+            continue  # Unreadable directory: skip it, as os.walk does
+
+        yield from files
+        stack.extend(reversed(subdirs))
+
+
+# Positional arguments of register_method_for_maybe_calls / add_pending_call,
+# pulled from the parser's dicts with one C-level call each
+_REGISTERED_METHOD_FIELDS = operator.itemgetter("entity_id", "name", "param_count", "module", "class_name")
+_PENDING_CALL_FIELDS = operator.itemgetter(
+    "caller_entity_id", "method_name", "arg_count", "caller_module", "caller_class"
+)
+
+# Anything float() can parse starts with whitespace, a sign, a (Unicode
+# decimal) digit, a dot, or the n/i of nan/inf; other values skip float()
+_NUMBER_START = frozenset("+-.0123456789nNiI")
+
+
+def _is_literal(value):
+    """True if add_triple() should treat an untyped object value as a literal"""
+    if isinstance(value, str):
+        head = value[:1]
+        if head == '"' or head == "'":
+            return True
+        # Most object values are names: reject them without a raising float()
+        if head not in _NUMBER_START and not (head.isdecimal() or head.isspace()):
+            return value.isdigit()
+    try:
+        float(value)
+        return True
+    except (ValueError, TypeError):
+        # isdigit() also admits digit characters float() rejects (e.g. superscripts)
+        return isinstance(value, str) and value.isdigit()
+
+
+def _triple_fact_dict(subject, predicate, object_value, prop_type):
+    """
+    Fact dict for a REQL-style triple (see Reter.add_triple)
+
+    Args:
+        subject, predicate, object_value: The triple
+        prop_type: "role", "data" or "same_as" if the predicate's kind is
+                   known, None to infer it from object_value
+
+    Returns:
+        dict suitable for owl_rete_cpp.Fact
+    """
+    if predicate == "type":
+        # Instance assertion: subject is an instance of object_value class
+        return {"type": "instance_of", "concept": object_value, "individual": subject}
+
+    if prop_type == "same_as":
+        # Same-as assertion
+        return {"type": "same_as", "ind1": subject, "ind2": object_value}
+
+    # Unknown property type - if the object looks like a number or string
+    # literal, assume data property; otherwise, assume object property
+    if prop_type == "data" or (prop_type is None and _is_literal(object_value)):
+        # Data property assertion
+        return {"type": "data_assertion", "property": predicate, "subject": subject, "value": object_value}
+
+    # Object property assertion
+    return {"type": "role_assertion", "role": predicate, "subject": subject, "object": object_value}
+
+
+def _iter_fact_dicts(table, chunksize=None):
+    """
+    Rows of an Arrow fact table as dicts of the fields each fact has
+
+    Absent fields come back from Arrow as nulls and are dropped. Rows are
+    converted one record batch (of at most chunksize rows) at a time, so the
+    intermediate null-padded dicts never exist for the whole table at once.
+    """
+    for batch in table.to_batches(max_chunksize=chunksize):
+        for row in batch.to_pylist():
+            yield {key: value for key, value in row.items() if value is not None}
+
+
+def _fact_dicts(table):
+    """List of _iter_fact_dicts(table)"""
+    return list(_iter_fact_dicts(table))
+
+
+def _unique_values(table, column, as_arrow=False):
+    """
+    Distinct values of one column of a fact table
+
+    Deduplicated in Arrow, so only the distinct values are ever converted to
+    Python objects (none at all with as_arrow=True). A missing column gives
+    no values.
+    """
+    if column in table.column_names and table.num_rows > 0:
+        values = pc.unique(table[column])
+    else:
+        values = pyarrow.array([], type=pyarrow.string())
+    return values if as_arrow else values.to_pylist()
+
+
+def _caller_owned(result):
+    """
+    Hand out a memoized result without sharing the memo's object
+
+    Arrow tables get a new Table over the same immutable buffers, so a
+    caller's to_pandas(self_destruct=True) cannot break the memoized one.
+    Other results (dl_ask booleans) are immutable already.
+    """
+    if isinstance(result, pyarrow.Table):
+        return result.slice(0)
+    return result
+
+
+# Upper bound on memoized pattern() cache keys before the memo is reset
+_QUERY_KEY_MEMO_SIZE = 4096
+
+
+def _freeze(value):
+    """Recursively convert lists, dicts and sets into hashable tuples"""
+    # Strings are by far the most common leaves (pattern terms)
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple([_freeze(item) for item in value])
+    if isinstance(value, dict):
+        return tuple(sorted([(key, _freeze(item)) for key, item in value.items()], key=repr))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted([_freeze(item) for item in value], key=repr))
+    return value
+
+
+def _normalize_query_key(patterns, where, values, not_exists):
+    """
+    Canonical hashable key for a pattern() query
+
+    Equal queries map to equal keys regardless of list vs tuple arguments or
+    the insertion order of the values dict.
+    """
+    return (
+        _freeze(patterns),
+        _freeze(where) if where else None,
+        _freeze(values) if values else None,
+        _freeze(not_exists) if not_exists else None,
+    )
+
+
+def _query_cache_name(query_key):
+    """
+    Production name for a normalized query key
+
+    A 128-bit blake2b digest of the key's repr: stable across processes
+    (unlike hash(), which is salted per process by PYTHONHASHSEED) and wide
+    enough that two different queries never share a production in practice.
+    """
+    return hashlib.blake2b(repr(query_key).encode(), digest_size=16).hexdigest()
+
+
+def _triple_condition_specs(subj, pred, obj, prop_type):
+    """
+    (field, value) pairs a triple pattern requires of a single fact
+
+    Args:
+        subj, pred, obj: Triple pattern elements (variables start with '?')
+        prop_type: "role", "data" or "same_as" for non-type predicates
+
+    Returns:
+        Tuple of (field, value) pairs
+    """
+    if pred == "type":
+        # (?x, type, Person) maps to instance_of facts
+        return (("type", "instance_of"), ("concept", obj), ("individual", subj))
+    if prop_type == "same_as":
+        # same_as facts use ind1/ind2 fields
+        return (("type", "same_as"), ("ind1", subj), ("ind2", obj))
+    if prop_type == "data":
+        # Data property: data_assertion with subject, property, value
+        return (("type", "data_assertion"), ("property", pred), ("subject", subj), ("value", obj))
+    # Object property: role_assertion with subject, role, object
+    return (("type", "role_assertion"), ("role", pred), ("subject", subj), ("object", obj))
+
+
+@functools.lru_cache(maxsize=1024)
+def _pattern_condition_specs(patterns, prop_types):
+    """
+    Condition arguments (fact_var, field, value) for a whole pattern list
+
+    Cached per pattern shape and property typing, so repeat builds only
+    construct the Condition objects. Each triple gets its own fact variable,
+    numbered by the count of conditions before it (?f_0, ?f_3, ...).
+    """
+    specs = []
+    for (subj, pred, obj), prop_type in zip(patterns, prop_types):
+        fact_var = f"?f_{len(specs)}"
+        specs.extend((fact_var, field, value) for field, value in _triple_condition_specs(subj, pred, obj, prop_type))
+    return tuple(specs)
+
+
+def _order_by_selectivity(patterns, cardinalities):
+    """
+    Greedy join order for triple patterns, most selective first
+
+    Starts from the pattern with the fewest matching facts, then repeatedly
+    takes the cheapest pattern sharing a variable with those already placed
+    (falling back to any pattern once a connected group is exhausted), so
+    each join step stays as small as the estimates allow. Ties keep the
+    caller's order.
+
+    Args:
+        patterns: Sequence of (subject, predicate, object) triples
+        cardinalities: Estimated number of matching facts per pattern
+
+    Returns:
+        List of the same patterns in join order
+    """
+    remaining = list(range(len(patterns)))
+    ordered = []
+    bound = set()
+    while remaining:
+        connected = [
+            i for i in remaining
+            if patterns[i][0] in bound or patterns[i][2] in bound
+        ]
+        best = min(connected or remaining, key=lambda i: (cardinalities[i], i))
+        remaining.remove(best)
+        subj, _, obj = patterns[best]
+        ordered.append(patterns[best])
+        bound.update(term for term in (subj, obj) if term.startswith("?"))
+    return ordered
+
+
+@functools.lru_cache(maxsize=1024)
+def _pattern_variables(patterns):
+    """Sorted variables bound by a pattern list, cached per pattern shape"""
+    variables = set()
+    for (subj, pred, obj) in patterns:
+        if subj.startswith("?"):
+            variables.add(subj)
+        if obj.startswith("?"):
+            variables.add(obj)
+    return tuple(sorted(variables))
+
+
+# Bump when the layout of cached parser output changes
+_PARSE_CACHE_FORMAT = 1
+
+
+def _parse_cache_path(cache_dir, language, *key_parts):
+    """
+    Path of the cache entry for one parse, keyed by a hash of its inputs
+
+    The key covers the cache format and the reter_core version and build
+    timestamp, so entries written by a different parser are never reused.
+    """
+    hasher = hashlib.sha256()
+    for part in (
+        str(_PARSE_CACHE_FORMAT),
+        getattr(owl_rete_cpp, "__version__", "unknown"),
+        getattr(owl_rete_cpp, "__build_timestamp__", "unknown"),
+    ) + key_parts:
+        hasher.update(part.encode("utf-8", "surrogatepass"))
+        hasher.update(b"\0")
+    digest = hasher.hexdigest()
+    return os.path.join(cache_dir, language, digest[:2], digest + ".pickle")
+
+
+def _parse_python_source(python_code, in_file, module_name, cache_dir=None):
+    """
+    Run owl_rete_cpp.parse_python_code, optionally through an on-disk cache
+
+    With cache_dir set, the parser output for identical (source, in_file,
+    module_name) input is pickled under cache_dir and replayed on later calls
+    instead of parsing again. The cache is best-effort: unreadable entries are
+    re-parsed and write failures are ignored. Only point cache_dir at a
+    directory you trust, since entries are loaded with pickle.
+
+    Returns:
+        Tuple of (facts, errors, registered_methods, unresolved_calls)
+    """
+    if cache_dir is None:
+        return owl_rete_cpp.parse_python_code(python_code, in_file, module_name)
+
+    path = _parse_cache_path(cache_dir, "py", in_file, module_name, python_code)
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass  # Miss or unreadable entry: parse again
+
+    parsed = owl_rete_cpp.parse_python_code(python_code, in_file, module_name)
+
+    # Write to a temporary file first so readers never see a partial entry
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        tmp_path = None
+    except (OSError, TypeError, pickle.PicklingError):
+        pass  # Caching is best-effort
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    return parsed
+
+
+def _parse_python_file(filepath, module_name, cache_dir=None):
+    """
+    Read and parse one Python file without touching a RETE network
+
+    Used as the worker function for load_python_directory(workers=N), so it
+    stays at module level (picklable) and only returns plain parser output.
+
+    Returns:
+        Tuple of (in_file, (facts, errors, registered_methods, unresolved_calls))
+    """
+    in_file = filepath.replace("\\", "/")
+    with open(filepath, 'r', encoding='utf-8') as f:
+        python_code = f.read()
+    return in_file, _parse_python_source(python_code, in_file, module_name, cache_dir)
+
+
+def _changes_facts(method):
+    """
+    Decorate a Reter method that adds facts to the network
+
+    Bumps the reasoner's change counter when the method returns or raises
+    (a failed load may still have added some facts), so memoized
+    fact-derived data keyed on Reter._generation() is recomputed.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._version += 1
+    return wrapper
+
 
 class Reter:
     """
@@ -73,6 +491,37 @@ class Reter:
         """
         self.network = owl_rete_cpp.ReteNetwork()
         self.variant = variant
+        self._query_cache_keys = {}  # normalized pattern() query -> (production cache key, variables)
+        self._live_cache_keys = {}  # normalized live_pattern() query -> live query cache key
+        self._live_join_orders = {}  # (cache key, frozen patterns) -> (generation, patterns in join order)
+        self._version = 0  # bumped by every change made through this Reter
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        """
+        Drop everything memoized from the network's facts
+
+        Called by removals and snapshot loads, which can leave the fact count
+        unchanged. Also bumps the change counter, which invalidates memos
+        held outside the reasoner (e.g. PropertyPathResultSet closures).
+        """
+        self._version += 1
+        self._property_types = None  # predicate -> "role" / "data" for all facts
+        self._property_types_generation = None
+        self._dl_results = {}  # (kind, expression, variant) -> dl_query / dl_ask result
+        self._dl_results_generation = None
+        self._cardinalities = {}  # frozen constant filters -> matching fact count
+        self._cardinalities_generation = None
+
+    def _generation(self):
+        """
+        Key for data memoized from the network's facts
+
+        Combines the counter bumped by every change made through this Reter
+        with network.fact_count(), which also catches facts added to
+        reasoner.network directly.
+        """
+        return (self._version, self.network.fact_count())
 
     def load_ontology_file(self, filepath):
         """
@@ -89,6 +538,7 @@ class Reter:
 
         return self.load_ontology(content)
 
+    @_changes_facts
     def load_ontology(self, dl_text, source=None):
         """
         Parse DL text and add to RETE network using C++ parser
@@ -111,6 +561,7 @@ class Reter:
         except Exception as e:
             raise RuntimeError(f"Failed to load ontology: {e}")
 
+    @_changes_facts
     def load_cnl(self, cnl_text, source=None):
         """
         Parse CNL (Controlled Natural Language) text and add to RETE network
@@ -144,20 +595,22 @@ class Reter:
             # Parse CNL to get facts
             result = owl_rete_cpp.parse_cnl(cnl_text)
 
+            # Resolve bound methods and the Fact constructor once, not per fact
+            add_fact = self.network.add_fact
+            add_fact_with_source = self.network.add_fact_with_source
+            make_fact = owl_rete_cpp.Fact
+
             # Add each fact to the network
             wme_count = 0
             for fact_obj in result.facts:
                 # Convert ParsedFact to Fact dict
-                fact_dict = {}
-                for key in fact_obj.keys():
-                    fact_dict[key] = fact_obj.get(key)
-
-                fact = owl_rete_cpp.Fact(fact_dict)
+                get = fact_obj.get
+                fact = make_fact({key: get(key) for key in fact_obj.keys()})
 
                 if source is None:
-                    self.network.add_fact(fact)
+                    add_fact(fact)
                 else:
-                    self.network.add_fact_with_source(fact, source)
+                    add_fact_with_source(fact, source)
                 wme_count += 1
 
             return wme_count
@@ -222,13 +675,12 @@ class Reter:
                 for fact in facts:
                     print(f"  {fact}")
         """
-        from reter_core import owl_rete_cpp
         # Pass module_name as both in_file and module_name for backward compatibility
         # (when used standalone without file path context)
         in_file = module_name + ".py" if not module_name.endswith(".py") else module_name
         return owl_rete_cpp.parse_python_code(python_code, in_file, module_name)
 
-    def load_python_file(self, filepath, module_name=None, progress_callback=None):
+    def load_python_file(self, filepath, module_name=None, progress_callback=None, cache_dir=None):
         """
         Load and parse Python source file, extracting semantic facts
 
@@ -236,6 +688,7 @@ class Reter:
             filepath: Path to Python source file
             module_name: Optional module name (defaults to filename without .py)
             progress_callback: Optional callback function(items_processed, total_items, message)
+            cache_dir: Optional directory for the on-disk parse cache (see load_python_code)
 
         Returns:
             Tuple of (wme_count, errors) where:
@@ -256,8 +709,6 @@ class Reter:
                 for err in errors:
                     print(f"  Line {err['line']}: {err['message']}")
         """
-        import os
-
         # Use filepath as in_file (normalized to forward slashes)
         in_file = filepath.replace("\\", "/")
 
@@ -269,9 +720,9 @@ class Reter:
             python_code = f.read()
 
         # Call load_python_code with correct parameters
-        return self.load_python_code(python_code, in_file, module_name, None, progress_callback)
+        return self.load_python_code(python_code, in_file, module_name, None, progress_callback, cache_dir=cache_dir)
 
-    def load_python_code(self, python_code, in_file="module.py", module_name=None, source_id=None, progress_callback=None):
+    def load_python_code(self, python_code, in_file="module.py", module_name=None, source_id=None, progress_callback=None, cache_dir=None):
         """
         Parse Python source code and extract semantic facts
 
@@ -283,6 +734,9 @@ class Reter:
             source_id: Optional source identifier for tracking (defaults to in_file).
                        Should be in format "md5|path" for proper file change detection.
             progress_callback: Optional callback function(items_processed, total_items, message)
+            cache_dir: Optional directory for an on-disk parse cache. Parser output is
+                       keyed by a hash of the source, in_file, module_name and the
+                       reter_core build, and replayed instead of re-parsing unchanged code.
 
         Returns:
             Tuple of (wme_count, errors) where:
@@ -313,75 +767,93 @@ class Reter:
             # Now query the extracted facts
             classes = reasoner.pattern(("?x", "type", "py:Class"))
         """
-        # Use parse_python_code that returns (facts, errors, registered_methods, unresolved_calls)
-        from reter_core import owl_rete_cpp
-
         # Derive module_name from in_file if not provided
         if module_name is None:
-            module_name = in_file
-            if module_name.endswith(".py"):
-                module_name = module_name[:-3]
-            module_name = module_name.replace("/", ".").replace("\\", ".")
+            module_name = _module_name_from_path(in_file)
 
-        facts, errors, registered_methods, unresolved_calls = owl_rete_cpp.parse_python_code(python_code, in_file, module_name)
+        # parse_python_code returns (facts, errors, registered_methods, unresolved_calls)
+        parsed = _parse_python_source(python_code, in_file, module_name, cache_dir)
 
         # Use source_id if provided, otherwise fall back to in_file
         actual_source_id = source_id if source_id is not None else in_file
 
+        return self._add_parsed_python(parsed, in_file, actual_source_id, progress_callback)
+
+    @_changes_facts
+    def _add_parsed_python(self, parsed, in_file, actual_source_id, progress_callback=None):
+        """
+        Add the output of owl_rete_cpp.parse_python_code to the network
+
+        Args:
+            parsed: Tuple of (facts, errors, registered_methods, unresolved_calls)
+            in_file: File path used in progress messages
+            actual_source_id: Source identifier the facts are tracked under
+            progress_callback: Optional callback function(items_processed, total_items, message)
+
+        Returns:
+            Tuple of (wme_count, errors)
+        """
+        facts, errors, registered_methods, unresolved_calls = parsed
+
         # Calculate total items for progress reporting
         total_items = len(facts) + len(registered_methods) + len(unresolved_calls)
         items_processed = 0
 
-        # Add facts to the network
-        wme_count = 0
-        for fact in facts:
-            self.network.add_fact_with_source(
-                owl_rete_cpp.Fact(fact),
-                actual_source_id  # Use source_id for tracking
-            )
-            wme_count += 1
-            items_processed += 1
-            if progress_callback and items_processed % 100 == 0:
-                progress_callback(items_processed, total_items, f"Adding facts from {in_file}")
+        # Add facts to the network (bound method and constructor resolved once)
+        add_fact_with_source = self.network.add_fact_with_source
+        make_fact = owl_rete_cpp.Fact
+        if progress_callback is None:
+            # No progress reporting: skip the per-fact counters entirely
+            for fact in facts:
+                add_fact_with_source(make_fact(fact), actual_source_id)
+            wme_count = len(facts)
+            items_processed = wme_count
+        else:
+            wme_count = 0
+            for fact in facts:
+                add_fact_with_source(
+                    make_fact(fact),
+                    actual_source_id  # Use source_id for tracking
+                )
+                wme_count += 1
+                items_processed += 1
+                if items_processed % 100 == 0:
+                    progress_callback(items_processed, total_items, f"Adding facts from {in_file}")
 
         # Register methods for maybeCalls resolution
+        register_method = self.network.register_method_for_maybe_calls
         for method in registered_methods:
-            self.network.register_method_for_maybe_calls(
-                method["entity_id"],
-                method["name"],
-                method["param_count"],
-                method["module"],
-                method["class_name"]
-            )
-            items_processed += 1
+            register_method(*_REGISTERED_METHOD_FIELDS(method))
+        items_processed += len(registered_methods)
 
         if progress_callback and registered_methods:
             progress_callback(items_processed, total_items, f"Registered {len(registered_methods)} methods")
 
         # Add pending calls for maybeCalls resolution
+        add_pending_call = self.network.add_pending_call
         for call in unresolved_calls:
-            self.network.add_pending_call(
-                call["caller_entity_id"],
-                call["method_name"],
-                call["arg_count"],
-                call["caller_module"],
-                call["caller_class"]
-            )
-            items_processed += 1
+            add_pending_call(*_PENDING_CALL_FIELDS(call))
+        items_processed += len(unresolved_calls)
 
         if progress_callback:
             progress_callback(total_items, total_items, f"Completed {in_file}: {wme_count} WMEs")
 
         return wme_count, errors
 
-    def load_python_directory(self, directory, recursive=True, progress_callback=None):
+    def load_python_directory(self, directory, recursive=True, progress_callback=None, workers=1, cache_dir=None):
         """
         Load all Python files from a directory
 
         Args:
             directory: Path to directory containing Python files
-            recursive: If True, recursively scan subdirectories
+            recursive: If True, recursively scan subdirectories (symlinked
+                       directories are followed, each directory once)
             progress_callback: Optional callback function(items_processed, total_items, message)
+            workers: Number of processes used to parse files (default 1: parse
+                     in this process). None uses os.cpu_count(). Parsing runs in
+                     the workers; facts are always added to the network here,
+                     in file order, so results match the serial load.
+            cache_dir: Optional directory for the on-disk parse cache (see load_python_code)
 
         Returns:
             Tuple of (total_wmes, all_errors) where:
@@ -412,23 +884,39 @@ class Reter:
                 ("?class", "name", "?name")
             )
         """
-        import os
-        import glob
-
         total_wmes = 0
         all_errors = {}
-        pattern = "**/*.py" if recursive else "*.py"
 
-        for filepath in glob.glob(os.path.join(directory, pattern), recursive=recursive):
-            # Skip __pycache__ directories
-            if "__pycache__" in filepath:
-                continue
+        # Hidden files/directories are skipped and symlinked directories are
+        # followed, as the previous glob-based scan did
+        filepaths = list(_iter_source_files(directory, ".py", recursive, skip_hidden=True, follow_symlinks=True))
+
+        # Generate module names from relative paths
+        module_names = [_module_name_from_path(os.path.relpath(filepath, directory)) for filepath in filepaths]
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers > 1 and len(filepaths) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Parse in worker processes; mutate the network only on this thread
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed_files = executor.map(
+                    _parse_python_file, filepaths, module_names, itertools.repeat(cache_dir), chunksize=8
+                )
+                for filepath, (in_file, parsed) in zip(filepaths, parsed_files):
+                    wmes, errors = self._add_parsed_python(parsed, in_file, in_file, progress_callback)
+                    total_wmes += wmes
+
+                    # Collect errors for this file
+                    if errors:
+                        all_errors[filepath] = errors
 
-            # Generate module name from relative path
-            rel_path = os.path.relpath(filepath, directory)
-            module_name = rel_path.replace(os.sep, ".").replace(".py", "")
+            return total_wmes, all_errors
 
-            wmes, errors = self.load_python_file(filepath, module_name, progress_callback)
+        for filepath, module_name in zip(filepaths, module_names):
+            wmes, errors = self.load_python_file(filepath, module_name, progress_callback, cache_dir=cache_dir)
             total_wmes += wmes
 
             # Collect errors for this file
@@ -437,6 +925,7 @@ class Reter:
 
         return total_wmes, all_errors
 
+    @_changes_facts
     def load_csharp_code(self, csharp_code, namespace_name="global", progress_callback=None):
         """Parse C# source code and extract semantic facts
 
@@ -449,7 +938,6 @@ class Reter:
             Number of WMEs added from the C# code
         """
         try:
-            from reter_core import owl_rete_cpp
             wme_count = owl_rete_cpp.load_csharp_from_string(
                 self.network,
                 csharp_code,
@@ -460,6 +948,7 @@ class Reter:
         except Exception as e:
             raise RuntimeError(f"Failed to load C# code: {e}")
 
+    @_changes_facts
     def load_cpp_code(self, cpp_code, namespace_name="global", progress_callback=None):
         """Parse C++ source code and extract semantic facts
 
@@ -472,7 +961,6 @@ class Reter:
             Number of WMEs added from the C++ code
         """
         try:
-            from reter_core import owl_rete_cpp
             wme_count = owl_rete_cpp.load_cpp_from_string(
                 self.network,
                 cpp_code,
@@ -483,6 +971,7 @@ class Reter:
         except Exception as e:
             raise RuntimeError(f"Failed to load C++ code: {e}")
 
+    @_changes_facts
     def load_javascript_code(self, javascript_code, module_name="module", progress_callback=None):
         """Parse JavaScript source code and extract semantic facts
 
@@ -495,7 +984,6 @@ class Reter:
             Number of WMEs added from the JavaScript code
         """
         try:
-            from reter_core import owl_rete_cpp
             wme_count = owl_rete_cpp.load_javascript_from_string(
                 self.network,
                 javascript_code,
@@ -517,7 +1005,6 @@ class Reter:
         Returns:
             Number of WMEs added from the C# file
         """
-        import os
         with open(filepath, 'r', encoding='utf-8') as f:
             code = f.read()
 
@@ -536,21 +1023,14 @@ class Reter:
         Returns:
             Total number of WMEs added
         """
-        import os
         total_wmes = 0
 
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.cs'):
-                    filepath = os.path.join(root, file)
-                    try:
-                        wmes = self.load_csharp_file(filepath)
-                        total_wmes += wmes
-                    except Exception as e:
-                        pass
-
-            if not recursive:
-                break
+        for filepath in _iter_source_files(directory, _CSHARP_SUFFIXES, recursive):
+            try:
+                wmes = self.load_csharp_file(filepath)
+                total_wmes += wmes
+            except Exception as e:
+                pass
 
         return total_wmes
 
@@ -565,7 +1045,6 @@ class Reter:
         Returns:
             Number of WMEs added from the C++ file
         """
-        import os
         with open(filepath, 'r', encoding='utf-8') as f:
             code = f.read()
 
@@ -584,21 +1063,14 @@ class Reter:
         Returns:
             Total number of WMEs added
         """
-        import os
         total_wmes = 0
 
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith(('.cpp', '.cc', '.cxx', '.h', '.hpp', '.hxx')):
-                    filepath = os.path.join(root, file)
-                    try:
-                        wmes = self.load_cpp_file(filepath)
-                        total_wmes += wmes
-                    except Exception as e:
-                        pass
-
-            if not recursive:
-                break
+        for filepath in _iter_source_files(directory, _CPP_SUFFIXES, recursive):
+            try:
+                wmes = self.load_cpp_file(filepath)
+                total_wmes += wmes
+            except Exception as e:
+                pass
 
         return total_wmes
 
@@ -613,7 +1085,6 @@ class Reter:
         Returns:
             Number of WMEs added from the JavaScript file
         """
-        import os
         with open(filepath, 'r', encoding='utf-8') as f:
             code = f.read()
 
@@ -632,24 +1103,18 @@ class Reter:
         Returns:
             Total number of WMEs added
         """
-        import os
         total_wmes = 0
 
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith(('.js', '.jsx', '.mjs')):
-                    filepath = os.path.join(root, file)
-                    try:
-                        wmes = self.load_javascript_file(filepath)
-                        total_wmes += wmes
-                    except Exception as e:
-                        pass
-
-            if not recursive:
-                break
+        for filepath in _iter_source_files(directory, _JAVASCRIPT_SUFFIXES, recursive):
+            try:
+                wmes = self.load_javascript_file(filepath)
+                total_wmes += wmes
+            except Exception as e:
+                pass
 
         return total_wmes
 
+    @_changes_facts
     def load_html_code(self, html_code, in_file="page.html", progress_callback=None):
         """Parse HTML source code and extract semantic facts
 
@@ -662,7 +1127,6 @@ class Reter:
             Number of WMEs added from the HTML code
         """
         try:
-            from reter_core import owl_rete_cpp
             wme_count = owl_rete_cpp.load_html_from_string(
                 self.network,
                 html_code,
@@ -684,7 +1148,6 @@ class Reter:
         Returns:
             Number of WMEs added from the HTML file
         """
-        import os
         with open(filepath, 'r', encoding='utf-8') as f:
             code = f.read()
 
@@ -703,24 +1166,18 @@ class Reter:
         Returns:
             Total number of WMEs added
         """
-        import os
         total_wmes = 0
 
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith(('.html', '.htm')):
-                    filepath = os.path.join(root, file)
-                    try:
-                        wmes = self.load_html_file(filepath)
-                        total_wmes += wmes
-                    except Exception as e:
-                        pass
-
-            if not recursive:
-                break
+        for filepath in _iter_source_files(directory, _HTML_SUFFIXES, recursive):
+            try:
+                wmes = self.load_html_file(filepath)
+                total_wmes += wmes
+            except Exception as e:
+                pass
 
         return total_wmes
 
+    @_changes_facts
     def add_fact(self, fact_dict, source=None):
         """
         Add a single fact using a dictionary specification.
@@ -741,7 +1198,6 @@ class Reter:
             add_triple(): High-level API for adding semantic triples
         """
         # Convert dict to Fact object before passing to C++
-        from reter_core import owl_rete_cpp
         fact = owl_rete_cpp.Fact(fact_dict)
 
         # Use source tracking if provided
@@ -782,83 +1238,74 @@ class Reter:
             # With source tracking
             reasoner.add_triple("Alice", "type", "Person", source="my_data")
         """
-        from reter_core import owl_rete_cpp
+        # Check if this is a known data property or object property
+        # by inspecting existing facts in the network
+        prop_type = None
+        if predicate != "type":
+            prop_type = self._detect_property_types({predicate}).get(predicate)
 
-        # Detect triple type and create proper fact structure
-        if predicate == "type":
-            # Instance assertion: subject is an instance of object_value class
-            fact_dict = {
-                "type": "instance_of",
-                "concept": object_value,
-                "individual": subject
-            }
-        else:
-            # Check if this is a known data property or object property
-            # by inspecting existing facts in the network
-            property_types = self._detect_property_types({predicate})
-            prop_type = property_types.get(predicate)
-
-            if prop_type == "data":
-                # Data property assertion
-                fact_dict = {
-                    "type": "data_assertion",
-                    "property": predicate,
-                    "subject": subject,
-                    "value": object_value
-                }
-            elif prop_type == "role":
-                # Object property assertion
-                fact_dict = {
-                    "type": "role_assertion",
-                    "role": predicate,
-                    "subject": subject,
-                    "object": object_value
-                }
-            elif prop_type == "same_as":
-                # Same-as assertion
-                fact_dict = {
-                    "type": "same_as",
-                    "ind1": subject,
-                    "ind2": object_value
-                }
+        # Create fact and add to network
+        fact_dict = _triple_fact_dict(subject, predicate, object_value, prop_type)
+        fact = owl_rete_cpp.Fact(fact_dict)
+        # Bumps the change counter itself (rather than via @_changes_facts)
+        # so the property type cache can be carried over the bump below
+        try:
+            if source is None:
+                fact_id = self.network.add_fact(fact)
             else:
-                # Unknown property type - try to infer from object value
-                # If object looks like a number or string literal, assume data property
-                # Otherwise, assume object property
-                try:
-                    # Try to parse as number
-                    float(object_value)
-                    is_literal = True
-                except (ValueError, TypeError):
-                    # Not a number - check if it's clearly a literal (contains quotes, etc.)
-                    is_literal = isinstance(object_value, str) and (
-                        object_value.startswith('"') or object_value.startswith("'") or
-                        object_value.isdigit()
-                    )
+                fact_id = self.network.add_fact_with_source(fact, source)
+        finally:
+            self._version += 1
 
-                if is_literal:
-                    # Assume data property
-                    fact_dict = {
-                        "type": "data_assertion",
-                        "property": predicate,
-                        "subject": subject,
-                        "value": object_value
-                    }
-                else:
-                    # Assume object property
-                    fact_dict = {
-                        "type": "role_assertion",
-                        "role": predicate,
-                        "subject": subject,
-                        "object": object_value
-                    }
+        self._note_added_fact(fact_dict)
+        return fact_id
 
-        # Create fact and add to network
-        fact = owl_rete_cpp.Fact(fact_dict)
-        if source is None:
-            return self.network.add_fact(fact)
-        else:
-            return self.network.add_fact_with_source(fact, source)
+    @_changes_facts
+    def add_triples(self, triples, source=None):
+        """
+        Add many semantic triples at once (bulk version of add_triple)
+
+        Property types are detected once for the whole batch instead of once
+        per triple. A predicate not yet in the network takes its type from its
+        first triple here, exactly as successive add_triple() calls would.
+
+        Args:
+            triples: Iterable of (subject, predicate, object_value) tuples
+            source: Optional source identifier for tracking
+
+        Returns:
+            List of fact IDs assigned by the network, one per triple
+
+        Example:
+            reasoner.add_triples([
+                ("Alice", "type", "Person"),
+                ("Alice", "hasAge", "30"),
+                ("Alice", "knows", "Bob"),
+            ])
+        """
+        triples = list(triples)
+        property_types = self._detect_property_types(
+            {predicate for (_, predicate, _) in triples if predicate != "type"}
+        )
+
+        make_fact = owl_rete_cpp.Fact
+        add_fact = self.network.add_fact
+        add_fact_with_source = self.network.add_fact_with_source
+
+        fact_ids = []
+        for subject, predicate, object_value in triples:
+            prop_type = property_types.get(predicate)
+            fact_dict = _triple_fact_dict(subject, predicate, object_value, prop_type)
+            if prop_type is None and predicate != "type":
+                # First use of an unknown predicate fixes its type for the rest of the batch
+                property_types[predicate] = "data" if fact_dict["type"] == "data_assertion" else "role"
+
+            fact = make_fact(fact_dict)
+            if source is None:
+                fact_ids.append(add_fact(fact))
+            else:
+                fact_ids.append(add_fact_with_source(fact, source))
+        return fact_ids
 
     def _detect_property_types(self, predicates):
         """
@@ -878,21 +1325,98 @@ class Reter:
             property_types["same_as"] = "same_as"
             property_types["sameAs"] = "same_as"
 
-        for fact in self.network.get_all_facts():
-            fact_type = fact.get("type")
-
-            if fact_type == "role_assertion":
-                role = fact.get("role")
-                if role and role in predicates:
-                    property_types[role] = "role"
-
-            elif fact_type == "data_assertion":
-                prop = fact.get("property")
-                if prop and prop in predicates:
-                    property_types[prop] = "data"
+        # Types of every predicate in the network, rescanned only when facts change
+        all_types = self._all_property_types()
+        for predicate in predicates:
+            prop_type = all_types.get(predicate)
+            if prop_type is not None:
+                property_types[predicate] = prop_type
 
         return property_types
 
+    def _all_property_types(self):
+        """
+        Map every role/property in the network to "role" or "data"
+
+        Cached on the reasoner generation (see _generation()), so add_triple()
+        and pattern() only rescan all facts after the network has changed.
+        """
+        generation = self._generation()
+        if self._property_types is None or generation != self._property_types_generation:
+            # Distinct names straight from the network's indexed Arrow query,
+            # instead of converting every fact to a Python dict
+            roles = self._distinct_fact_values({"type": "role_assertion"}, "role")
+            props = self._distinct_fact_values({"type": "data_assertion"}, "property")
+
+            all_types = dict.fromkeys(roles, "role")
+            all_types.update(dict.fromkeys(props, "data"))
+
+            # A name used both ways takes the type of its last fact; only
+            # those (rare) names need the fact-by-fact scan
+            ambiguous = roles & props
+            if ambiguous:
+                for fact in self.network.get_all_facts():
+                    fact_type = fact.get("type")
+                    if fact_type == "role_assertion" and fact.get("role") in ambiguous:
+                        all_types[fact.get("role")] = "role"
+                    elif fact_type == "data_assertion" and fact.get("property") in ambiguous:
+                        all_types[fact.get("property")] = "data"
+
+            self._property_types = all_types
+            self._property_types_generation = generation
+        return self._property_types
+
+    def _note_added_fact(self, fact_dict):
+        """
+        Carry the property type cache over a fact just added
+
+        Without this every add_triple() would move the generation and force
+        the next call to rescan all facts. Called after add_triple() has
+        bumped the change counter; the cache is only carried over when it
+        was current just before that one bump and the add grew the network
+        by exactly that one fact. If anything else changed, or rules
+        inferred further facts from it, the cache is rebuilt on next use.
+        """
+        if self._property_types is None:
+            return
+        generation = self._generation()
+        version, fact_count = generation
+        if self._property_types_generation != (version - 1, fact_count - 1):
+            return
+
+        # The new fact is now the last one using its name, so it wins
+        fact_type = fact_dict["type"]
+        if fact_type == "role_assertion":
+            self._property_types[fact_dict["role"]] = "role"
+        elif fact_type == "data_assertion":
+            self._property_types[fact_dict["property"]] = "data"
+        self._property_types_generation = generation
+
+    def _estimate_cardinality(self, specs):
+        """
+        Number of facts matching the constant (field, value) pairs of specs
+
+        The extension has no count-only lookup, so the indexed query is
+        materialized; counts are memoized per reasoner generation so each
+        distinct filter is only counted once until the network changes.
+        """
+        generation = self._generation()
+        if generation != self._cardinalities_generation:
+            self._cardinalities.clear()
+            self._cardinalities_generation = generation
+        key = tuple(pair for pair in specs if not pair[1].startswith("?"))
+        count = self._cardinalities.get(key)
+        if count is None:
+            count = self._cardinalities[key] = self.network.query(dict(key)).num_rows
+        return count
+
+    def _distinct_fact_values(self, filters, column):
+        """Set of non-empty values of column over facts matching filters"""
+        table = self.network.query(filters)
+        if column not in table.column_names:
+            return set()
+        return {value for value in pc.unique(table.column(column)).to_pylist() if value}
+
     def pattern(self, *patterns, cache=None, select=None, where=None, values=None, not_exists=None):
         """
         Query using graph patterns with optional filters, VALUES, and NOT EXISTS constraints
@@ -944,33 +1468,30 @@ class Reter:
                 print(binding["?x"], binding["?age"])
         """
         # Auto-generate cache key if not provided
-        # Use hash() instead of MD5 for much faster cache key generation
         if cache is None:
-            # Create a hashable tuple representation
-            # Convert values dict to hashable format (lists → tuples)
-            hashable_values = None
-            if values:
-                hashable_values = tuple(
-                    (k, tuple(v) if isinstance(v, list) else v)
-                    for k, v in sorted(values.items())
+            # Canonical, fully hashable form of the query (lists → tuples,
+            # values sorted), memoized together with the pattern variables so
+            # repeat queries skip both key derivation and variable extraction
+            query_key = _normalize_query_key(patterns, where, values, not_exists)
+            memo = self._query_cache_keys.get(query_key)
+            if memo is None:
+                if len(self._query_cache_keys) >= _QUERY_KEY_MEMO_SIZE:
+                    self._query_cache_keys.clear()
+                memo = self._query_cache_keys[query_key] = (
+                    _query_cache_name(query_key),
+                    _pattern_variables(query_key[0]),
                 )
-
-            cache_tuple = (patterns, tuple(where) if where else None,
-                          hashable_values,
-                          tuple(not_exists) if not_exists else None)
-            cache = str(hash(cache_tuple))
+            cache, variables = memo
+            frozen_patterns = query_key[0]
+        else:
+            # Variables for return (needed even on cache hit), memoized per
+            # pattern shape so repeat queries skip the scan
+            frozen_patterns = _freeze(patterns)
+            variables = _pattern_variables(frozen_patterns)
 
         # Check if we have a cached production FIRST (before expensive work)
         cached_production = self.network.get_cached_query(cache)
 
-        # Extract variables for return (needed even on cache hit)
-        variables = set()
-        for (subj, pred, obj) in patterns:
-            if subj.startswith("?"):
-                variables.add(subj)
-            if obj.startswith("?"):
-                variables.add(obj)
-
         if cached_production is None:
             # Cache miss - need to build the production
             # Convert triple patterns to Condition objects
@@ -978,41 +1499,17 @@ class Reter:
             predicates = {pred for (subj, pred, obj) in patterns if pred != "type"}
             property_types = self._detect_property_types(predicates)
 
-            conditions = []
-
-            for (subj, pred, obj) in patterns:
-                # Map triple pattern to WME conditions based on actual fact types
-
-                if pred == "type":
-                    # (?x, type, Person) maps to instance_of facts
-                    fact_var = f"?f_{len(conditions)}"
-                    conditions.append(owl_rete_cpp.Condition(fact_var, "type", "instance_of"))
-                    conditions.append(owl_rete_cpp.Condition(fact_var, "concept", obj))
-                    conditions.append(owl_rete_cpp.Condition(fact_var, "individual", subj))
-                else:
-                    # Use detected property type, with fallback to role_assertion
-                    prop_type = property_types.get(pred, "role")  # Default to role if unknown
-
-                    fact_var = f"?f_{len(conditions)}"
-                    if prop_type == "same_as":
-                        # same_as facts use ind1/ind2 fields
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "type", "same_as"))
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "ind1", subj))
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "ind2", obj))
-                    elif prop_type == "data":
-                        # Data property: data_assertion with subject, property, value
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "type", "data_assertion"))
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "property", pred))
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "subject", subj))
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "value", obj))
-                    else:
-                        # Object property: role_assertion with subject, role, object
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "type", "role_assertion"))
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "role", pred))
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "subject", subj))
-                        conditions.append(owl_rete_cpp.Condition(fact_var, "object", obj))
-
-                    # Variables already extracted above
+            # Map triple patterns to WME conditions based on actual fact types,
+            # with unknown predicates falling back to role_assertion
+            prop_types = tuple(
+                None if pred == "type" else property_types.get(pred, "role")
+                for (subj, pred, obj) in patterns
+            )
+            make_condition = owl_rete_cpp.Condition
+            conditions = [
+                make_condition(*spec)
+                for spec in _pattern_condition_specs(frozen_patterns, prop_types)
+            ]
 
             # Build query production (with filters, VALUES, or both)
             if values:
@@ -1030,7 +1527,7 @@ class Reter:
             production = cached_production
 
         # Determine which variables to return
-        return_vars = select if select else sorted(variables)
+        return_vars = select if select else list(variables)
 
         # If NOT EXISTS is specified, wrap in a FilteredQueryResultSet
         if not_exists:
@@ -1072,19 +1569,49 @@ class Reter:
             # Query property domains
             domains = r.query(type='property_domain', property='hasParent')
         """
-        # Python-side filtering (safe and reliable)
-        # TODO: Optimize with C++ Arrow query when stable
-        all_facts = list(self.network.get_all_facts())
-
-        # Filter by type if specified
+        # String equality filters go to the network's indexed Arrow query;
+        # only the matching rows are converted to Python objects
+        filters = dict(kwargs)
         if type is not None:
-            all_facts = [f for f in all_facts if f.get('type') == type]
+            filters['type'] = type
 
-        # Filter by additional kwargs
-        for key, value in kwargs.items():
-            all_facts = [f for f in all_facts if f.get(key) == value]
+        indexed_filters = {}
+        other_filters = {}
+        for key, value in filters.items():
+            if isinstance(value, str):
+                indexed_filters[key] = value
+            else:
+                other_filters[key] = value
 
-        return all_facts
+        if indexed_filters:
+            table = self.network.query(indexed_filters)
+        else:
+            table = self.get_all_facts()
+
+        # Remaining filters are applied as a mask over the matching rows:
+        # None matches facts that do not have the field at all, any other
+        # value is compared for equality with the column
+        mask = None
+        for key, value in other_filters.items():
+            if key not in table.column_names:
+                # No fact has this field, so only a None filter can match
+                if value is None:
+                    continue
+                return []
+            column = table.column(key)
+            if value is None:
+                condition = pc.is_null(column)
+            else:
+                try:
+                    condition = pc.fill_null(pc.equal(column, value), False)
+                except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError, TypeError):
+                    # Value not comparable with the column type: no fact matches
+                    return []
+            mask = condition if mask is None else pc.and_(mask, condition)
+        if mask is not None:
+            table = table.filter(mask)
+
+        return _fact_dicts(table)
 
     def union(self, *queries):
         """
@@ -1327,7 +1854,7 @@ class Reter:
             import pandas as pd
             df = result.to_pandas()
         """
-        return owl_rete_cpp.dl_query(self.network, dl_expression, self.variant)
+        return self._cached_dl(owl_rete_cpp.dl_query, "query", dl_expression)
 
     def dl_ask(self, dl_expression):
         """
@@ -1356,9 +1883,39 @@ class Reter:
             result = r.dl_ask("com.example.Person and Doctor")
             result = r.dl_ask("some hasChild.Doctor")
         """
-        result = owl_rete_cpp.dl_ask(self.network, dl_expression, self.variant)
+        result = self._cached_dl(owl_rete_cpp.dl_ask, "ask", dl_expression)
         return {"result": result}
 
+    def _cached_dl(self, evaluate, kind, dl_expression):
+        """
+        Evaluate a DL expression, memoized until the reasoner changes
+
+        Repeat queries with no change in between (same _generation()) skip
+        parsing and evaluating the expression again. A call that itself
+        changed the network is not memoized.
+
+        Args:
+            evaluate: owl_rete_cpp.dl_query or owl_rete_cpp.dl_ask
+            kind: Name distinguishing the two in the memo
+            dl_expression: DL expression in the reasoner's syntax variant
+
+        Returns:
+            The result, as a Table object owned by the caller for dl_query
+        """
+        key = (kind, dl_expression, self.variant)
+        generation = self._generation()
+        if generation == self._dl_results_generation and key in self._dl_results:
+            return _caller_owned(self._dl_results[key])
+
+        result = evaluate(self.network, dl_expression, self.variant)
+
+        if self._generation() == generation:
+            if generation != self._dl_results_generation or len(self._dl_results) >= _QUERY_KEY_MEMO_SIZE:
+                self._dl_results.clear()
+                self._dl_results_generation = generation
+            self._dl_results[key] = result
+        return _caller_owned(result)
+
     # ========================================================================
     # Template Query Methods (Week 3, Day 3-5)
     # Ultra-fast pre-compiled query templates with ~1μs performance
@@ -1537,37 +2094,56 @@ class Reter:
 
             live.on_change(on_update)
         """
-        import hashlib
-
-        # Auto-generate cache key if not provided
+        # Auto-generate cache key if not provided, from the same canonical
+        # form as pattern() but tagged so a live query never shares its name
+        # with a pattern() production; memoized so repeat builds skip hashing
         if cache is None:
-            pattern_str = str((patterns, where))
-            cache = hashlib.md5(pattern_str.encode()).hexdigest()[:16]
-
-        # Convert triple patterns to Condition objects (same as pattern())
-        conditions = []
+            live_key = ("live", _freeze(patterns), _freeze(where) if where else None)
+            cache = self._live_cache_keys.get(live_key)
+            if cache is None:
+                if len(self._live_cache_keys) >= _QUERY_KEY_MEMO_SIZE:
+                    self._live_cache_keys.clear()
+                cache = self._live_cache_keys[live_key] = _query_cache_name(live_key)
+
+        # Join the most selective patterns first to keep intermediate
+        # tokens small; the result set does not depend on the order. The
+        # join order is reused for repeat builds until the facts change,
+        # since the selectivities it was estimated from may have moved.
+        if len(patterns) > 1:
+            plan_key = (cache, _freeze(patterns))
+            generation = self._generation()
+            plan = self._live_join_orders.get(plan_key)
+            if plan is None or plan[0] != generation:
+                cardinalities = [
+                    self._estimate_cardinality(
+                        _triple_condition_specs(subj, pred, obj, None if pred == "type" else "data")
+                    )
+                    for (subj, pred, obj) in patterns
+                ]
+                if len(self._live_join_orders) >= _QUERY_KEY_MEMO_SIZE:
+                    self._live_join_orders.clear()
+                plan = self._live_join_orders[plan_key] = (
+                    generation, _order_by_selectivity(patterns, cardinalities)
+                )
+            patterns = plan[1]
+
+        # Convert triple patterns to Condition objects with the same cached
+        # condition specs as pattern(); live queries treat every non-type
+        # predicate as a data property
+        prop_types = tuple(None if pred == "type" else "data" for (subj, pred, obj) in patterns)
+        make_condition = owl_rete_cpp.Condition
+        conditions = [
+            make_condition(*spec)
+            for spec in _pattern_condition_specs(_freeze(patterns), prop_types)
+        ]
+
+        # Variables for return (a type pattern only contributes its subject)
         variables = set()
-
         for (subj, pred, obj) in patterns:
-            if pred == "type":
-                # (?x, type, Person) maps to instance_of facts
-                fact_var = f"?f_{len(conditions)}"
-                conditions.append(owl_rete_cpp.Condition(fact_var, "type", "instance_of"))
-                conditions.append(owl_rete_cpp.Condition(fact_var, "concept", obj))
-                conditions.append(owl_rete_cpp.Condition(fact_var, "individual", subj))
-                if subj.startswith("?"):
-                    variables.add(subj)
-            else:
-                # (?x, hasAge, ?age) maps to data_assertion facts
-                fact_var = f"?f_{len(conditions)}"
-                conditions.append(owl_rete_cpp.Condition(fact_var, "type", "data_assertion"))
-                conditions.append(owl_rete_cpp.Condition(fact_var, "subject", subj))
-                conditions.append(owl_rete_cpp.Condition(fact_var, "property", pred))
-                conditions.append(owl_rete_cpp.Condition(fact_var, "value", obj))
-                if subj.startswith("?"):
-                    variables.add(subj)
-                if obj.startswith("?"):
-                    variables.add(obj)
+            if subj.startswith("?"):
+                variables.add(subj)
+            if pred != "type" and obj.startswith("?"):
+                variables.add(obj)
 
         # Build live query
         if where:
@@ -1587,7 +2163,10 @@ class Reter:
             PyArrow Table (zero-copy, supports iteration, indexing, to_pandas())
         """
         # Return Arrow table directly for zero-copy access from Python
-        # Python can iterate, index, filter, or convert to pandas without copying
+        # Python can iterate, index, filter, or convert to pandas without copying.
+        # Every call builds a fresh table: callers may consume it destructively
+        # (to_pandas(self_destruct=True)), and a direct reasoner.network change
+        # that keeps the fact count could not be detected anyway.
         return self.network.get_all_facts_arrow()
 
     def get_inferred_facts(self):
@@ -1597,7 +2176,6 @@ class Reter:
         Returns:
             PyArrow Table with only inferred facts (zero-copy filtered)
         """
-        import pyarrow.compute as pc
         all_facts = self.get_all_facts()
 
         # Use Arrow compute to filter (zero-copy, very fast)
@@ -1608,92 +2186,62 @@ class Reter:
             # No 'inferred' column means no inferred facts
             return all_facts.slice(0, 0)  # Empty table with same schema
 
-    def get_instances(self, concept):
+    def get_instances(self, concept, as_arrow=False):
         """
         Get all instances of a concept
 
         Args:
             concept: Concept name
+            as_arrow: Return a pyarrow StringArray instead of a list, so the
+                      names are never converted to Python strings
 
         Returns:
             List of unique individual names (list for backwards compatibility)
         """
-        import pyarrow.compute as pc
-        all_facts = self.get_all_facts()
-
-        # Filter for instance_of facts with matching concept (zero-copy)
-        if 'type' in all_facts.column_names and 'concept' in all_facts.column_names:
-            type_mask = pc.equal(all_facts['type'], 'instance_of')
-            concept_mask = pc.equal(all_facts['concept'], concept)
-            mask = pc.and_(type_mask, concept_mask)
-            filtered = all_facts.filter(mask)
-        else:
-            # Return empty table if columns don't exist
-            filtered = all_facts.slice(0, 0)
+        # Indexed lookup of instance_of facts with matching concept. Missing columns
+        # give an empty table, without fetching or scanning all facts
+        filtered = self.network.query({'type': 'instance_of', 'concept': concept})
 
         # Extract 'individual' column and get unique values
-        if 'individual' in filtered.column_names and filtered.num_rows > 0:
-            individuals = filtered['individual'].to_pylist()
-            return list(set(individuals))  # Remove duplicates
-        return []
+        return _unique_values(filtered, 'individual', as_arrow)
 
-    def get_subsumers(self, concept):
+    def get_subsumers(self, concept, as_arrow=False):
         """
         Get all subsumers (superclasses) of a concept
 
         Args:
             concept: Concept name
+            as_arrow: Return a pyarrow StringArray instead of a list, so the
+                      names are never converted to Python strings
 
         Returns:
             List of unique subsumer concept names
         """
-        import pyarrow.compute as pc
-        all_facts = self.get_all_facts()
-
-        # Filter for subsumption facts with matching sub (zero-copy)
-        if 'type' in all_facts.column_names and 'sub' in all_facts.column_names:
-            type_mask = pc.equal(all_facts['type'], 'subsumption')
-            sub_mask = pc.equal(all_facts['sub'], concept)
-            mask = pc.and_(type_mask, sub_mask)
-            filtered = all_facts.filter(mask)
-        else:
-            # Return empty table if columns don't exist
-            filtered = all_facts.slice(0, 0)
+        # Indexed lookup of subsumption facts with matching sub. Missing columns
+        # give an empty table, without fetching or scanning all facts
+        filtered = self.network.query({'type': 'subsumption', 'sub': concept})
 
         # Extract 'sup' column and get unique values
-        if 'sup' in filtered.column_names and filtered.num_rows > 0:
-            subsumers = filtered['sup'].to_pylist()
-            return list(set(subsumers))
-        return []
+        return _unique_values(filtered, 'sup', as_arrow)
 
-    def get_subsumed(self, concept):
+    def get_subsumed(self, concept, as_arrow=False):
         """
         Get all subsumed concepts (subclasses) of a concept
 
         Args:
             concept: Concept name
+            as_arrow: Return a pyarrow StringArray instead of a list, so the
+                      names are never converted to Python strings
 
         Returns:
             List of unique subsumed concept names
         """
-        import pyarrow.compute as pc
-        all_facts = self.get_all_facts()
-
-        # Filter for subsumption facts with matching sup (zero-copy)
-        if 'type' in all_facts.column_names and 'sup' in all_facts.column_names:
-            type_mask = pc.equal(all_facts['type'], 'subsumption')
-            sup_mask = pc.equal(all_facts['sup'], concept)
-            mask = pc.and_(type_mask, sup_mask)
-            filtered = all_facts.filter(mask)
-        else:
-            # Return empty table if columns don't exist
-            filtered = all_facts.slice(0, 0)
+        # Indexed lookup of subsumption facts with matching sup. Missing columns
+        # give an empty table, without fetching or scanning all facts
+        filtered = self.network.query({'type': 'subsumption', 'sup': concept})
 
         # Extract 'sub' column and get unique values
-        if 'sub' in filtered.column_names and filtered.num_rows > 0:
-            subsumed = filtered['sub'].to_pylist()
-            return list(set(subsumed))
-        return []
+        return _unique_values(filtered, 'sub', as_arrow)
 
     def get_role_assertions(self, role=None, subject=None, object=None):
         """
@@ -1707,28 +2255,16 @@ class Reter:
         Returns:
             List of (subject, role, object) tuples
         """
-        import pyarrow.compute as pc
-        all_facts = self.get_all_facts()
-
-        # Build filter mask for role assertions (zero-copy filtering)
-        if 'type' not in all_facts.column_names:
-            return []
-
-        mask = pc.equal(all_facts['type'], 'role_assertion')
-
-        # Add optional filters
-        if role and 'role' in all_facts.column_names:
-            role_mask = pc.equal(all_facts['role'], role)
-            mask = pc.and_(mask, role_mask)
-        if subject and 'subject' in all_facts.column_names:
-            subject_mask = pc.equal(all_facts['subject'], subject)
-            mask = pc.and_(mask, subject_mask)
-        if object and 'object' in all_facts.column_names:
-            object_mask = pc.equal(all_facts['object'], object)
-            mask = pc.and_(mask, object_mask)
-
-        # Filter the table (zero-copy)
-        filtered = all_facts.filter(mask)
+        # All equality filters in one indexed network lookup, instead of a
+        # boolean mask per filter over the whole fact table
+        filters = {'type': 'role_assertion'}
+        if role:
+            filters['role'] = role
+        if subject:
+            filters['subject'] = subject
+        if object:
+            filters['object'] = object
+        filtered = self.network.query(filters)
 
         # Extract tuples (subject, role, object)
         if filtered.num_rows > 0:
@@ -1747,13 +2283,16 @@ class Reter:
         Returns:
             (is_consistent, list_of_inconsistencies)
         """
-        inconsistencies = self.query(type='inconsistency')
-
-        if inconsistencies:
-            return False, inconsistencies
-        else:
+        # Common case: no inconsistency facts, so nothing to convert
+        if not self._has_fact_type('inconsistency'):
             return True, []
 
+        return False, self.query(type='inconsistency')
+
+    def _has_fact_type(self, fact_type):
+        """Whether any fact of the given type exists (no rows converted)"""
+        return self.network.query({'type': fact_type}).num_rows > 0
+
     # ========================================================================
     # Source Tracking Methods (Phase 5)
     # ========================================================================
@@ -1794,7 +2333,9 @@ class Reter:
             r = Reter()
             r.load("snapshot.bin")
         """
-        return self.network.load(filename)
+        result = self.network.load(filename)
+        self._invalidate_caches()
+        return result
 
     def load_lazy(self, filename):
         """
@@ -1815,7 +2356,9 @@ class Reter:
             df = r.query("SELECT ?s ?p ?o")    # Query works immediately
             r.materialize()                     # Convert to eager if needed
         """
-        return self.network.load_lazy(filename)
+        result = self.network.load_lazy(filename)
+        self._invalidate_caches()
+        return result
 
     def is_lazy(self):
         """
@@ -1847,6 +2390,7 @@ class Reter:
             r.remove_source("ontology1")  # Removes ontology1 and derived facts
         """
         self.network.remove_source(source_id)
+        self._invalidate_caches()
 
     def get_all_sources(self):
         """
@@ -1882,33 +2426,51 @@ class Reter:
         all_facts = self.get_all_facts()
         inferred_facts = self.get_inferred_facts()
 
-        # Count facts by type
+        # Count facts by type (one hash aggregation over the type column)
         fact_types = {}
-        for fact in all_facts:
-            fact_type = fact.get('type', 'unknown')
-            fact_types[fact_type] = fact_types.get(fact_type, 0) + 1
+        if 'type' in all_facts.column_names:
+            counts = pc.value_counts(all_facts['type'])
+            fact_types = {
+                ('unknown' if fact_type is None else fact_type): count
+                for fact_type, count in zip(
+                    counts.field('values').to_pylist(),
+                    counts.field('counts').to_pylist(),
+                )
+            }
 
         # Check consistency
         is_consistent, inconsistencies = self.check_consistency()
 
-    def export_facts(self, filepath, format='human'):
+    def export_facts(self, filepath, format='human', chunksize=65536):
         """
         Export facts to file
 
+        Facts are converted and written one record batch at a time, so memory
+        use is bounded by chunksize rather than by the number of facts.
+
         Args:
             filepath: Output file path
             format: 'human' or 'json'
+            chunksize: Maximum number of facts converted at once
         """
+        # The Arrow table iterates by column, so convert rows explicitly
+        facts = _iter_fact_dicts(self.get_all_facts(), chunksize)
         with open(filepath, 'w', encoding='utf-8') as f:
             if format == 'human':
-                for fact in self.get_all_facts():
-                    inferred = " [INFERRED]" if fact.get('inferred') == 'true' else ""
-                    f.write(f"{fact}{inferred}\n")
+                f.writelines(
+                    f"{fact}{' [INFERRED]' if fact.get('inferred') == 'true' else ''}\n"
+                    for fact in facts
+                )
             elif format == 'json':
-                import json
-                facts_data = self.get_all_facts()
-                json.dump(facts_data, f, indent=2)
-
+                # Same layout as json.dump(facts, f, indent=2), written
+                # element by element instead of from one in-memory list
+                separator = "\n  "
+                f.write("[")
+                for fact in facts:
+                    f.write(separator)
+                    f.write(json.dumps(fact, indent=2).replace("\n", "\n  "))
+                    separator = ",\n  "
+                f.write("]" if separator == "\n  " else "\n]")
 
 def main():
     """Example usage"""
@@ -0,0 +1,156 @@
+"""
+Shared state for the transformer.py debug scripts.
+
+Loads transformer.py once, parses every probe in a fresh reasoner and
+memoizes probe results by content, so debug_transformer_parse.py,
+debug_transformer_binary_search.py, debug_transformer_narrow.py and
+debug_narrow_2500_2600.py only hold the analysis they print.
+"""
+import concurrent.futures
+import functools
+import hashlib
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from reter import Reter
+
+TRANSFORMER_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "..", "..", "reter_code", "src", "reter_code", "cadsl", "transformer.py"
+)
+
+# Read the file once as bytes; probes slice the bytes at line boundaries
+# and decode only the prefix they parse, instead of holding a str per line.
+# Newlines are normalized the way a text-mode read does, so a CRLF checkout
+# still sends the parser '\n' line endings
+with open(TRANSFORMER_PATH, 'rb') as f:
+    RAW = f.read().replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
+def _line_offsets(raw):
+    """Byte offset where each line starts, plus len(raw) as the final end."""
+    offsets = [0]
+    pos = raw.find(b"\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = raw.find(b"\n", pos + 1)
+    if offsets[-1] != len(raw):
+        offsets.append(len(raw))
+    return offsets
+
+
+# OFFSETS[k] is the byte length of the first k lines
+OFFSETS = _line_offsets(RAW)
+LINE_COUNT = len(OFFSETS) - 1
+
+
+def line(i):
+    """Line i (0-based) of the file, including its newline."""
+    return RAW[OFFSETS[i]:OFFSETS[i + 1]].decode('utf-8')
+
+
+def _parse_uncached(code):
+    """Try to parse code in a fresh reasoner and return (wme_count, errors)."""
+    reasoner = Reter()
+    try:
+        wme_count, errors = reasoner.load_python_code(code, "test.py")
+        return wme_count, errors
+    except Exception as e:
+        return -1, [str(e)]
+
+
+# Probe results by content digest: narrowing loops re-probe identical
+# prefixes, and a digest avoids keeping every probed source alive
+_parse_results = {}
+
+
+def try_parse(code):
+    """Try to parse code and return (wme_count, errors), memoized by content."""
+    key = hashlib.blake2b(code.encode("utf-8"), digest_size=16).digest()
+    if key not in _parse_results:
+        _parse_results[key] = _parse_uncached(code)
+    return _parse_results[key]
+
+
+@functools.lru_cache(maxsize=None)
+def parse_prefix(k, suffix=""):
+    """Parse the first k lines of transformer.py, optionally followed by suffix."""
+    return try_parse(RAW[:OFFSETS[k]].decode('utf-8') + suffix)
+
+
+def is_exception(errors):
+    """Check if the error is a C++ exception (not just syntax errors)."""
+    if not errors:
+        return False
+    err = errors[0]
+    if isinstance(err, dict):
+        return err.get('message', '').startswith('Parse failed: ')
+    return 'Parse failed' in str(err)
+
+
+def first_failing(total, fails):
+    """
+    Smallest k in 1..total with fails(k), or None if fails(total) is false.
+
+    Assumes that once a prefix fails, longer ones do too. Probes 1, 2, 4,
+    8, ... until a failure brackets the answer, then bisects the bracket,
+    so it takes O(log k) probes and needs no hand-picked range.
+    """
+    low, high = 0, 1
+    while True:
+        high = min(high, total)
+        if fails(high):
+            break
+        if high == total:
+            return None
+        low, high = high, high * 2
+
+    # fails(high) holds, and low is 0 or a passing prefix
+    while high - low > 1:
+        mid = (low + high) // 2
+        if fails(mid):
+            high = mid
+        else:
+            low = mid
+    return high
+
+
+def _parse_chunk(args):
+    """Parse one (start, end, code) chunk in a worker process."""
+    start, end, code = args
+    wmes, errors = _parse_uncached(code)
+    return start, end, wmes, errors
+
+
+def full_parse():
+    """Parse the whole file; later full-file probes hit the memo."""
+    return parse_prefix(LINE_COUNT)
+
+
+def chunk_sweep(size=100):
+    """
+    Parse the file in independent chunks of size lines.
+
+    Chunks run in worker processes (the C++ parse does not release the
+    GIL), so callers must sit behind an ``if __name__ == "__main__"`` guard.
+
+    Returns:
+        List of (start, end, wmes, errors) in line order
+    """
+    chunks = []
+    for start in range(0, LINE_COUNT, size):
+        end = min(start + size, LINE_COUNT)
+        chunks.append((start, end, RAW[OFFSETS[start]:OFFSETS[end]].decode('utf-8')))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return sorted(pool.map(_parse_chunk, chunks))
+
+
+def binary_search(fails):
+    """Shortest prefix length k for which fails(k) holds, or None."""
+    return first_failing(LINE_COUNT, fails)
+
+
+def pattern_probe(k, pattern_line):
+    """Parse the first k lines with pattern_line appended."""
+    return parse_prefix(k, pattern_line)
@@ -1,69 +1,57 @@
 #!/usr/bin/env python3
 """Binary search to find where transformer.py fails to parse."""
 import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from reter import Reter
-
-transformer_path = os.path.join(
-    os.path.dirname(__file__),
-    "..", "..", "reter_code", "src", "reter_code", "cadsl", "transformer.py"
+from _debug_transformer_harness import (
+    LINE_COUNT, RAW, binary_search, chunk_sweep, full_parse, parse_prefix,
 )
 
-with open(transformer_path, 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-
-print(f"Total lines: {len(lines)}")
-print(f"Total chars: {sum(len(l) for l in lines)}")
-
-def try_parse(code, label):
-    """Try to parse code and return (wme_count, errors)."""
-    reasoner = Reter()
-    try:
-        wme_count, errors = reasoner.load_python_code(code, "test.py")
-        return wme_count, errors
-    except Exception as e:
-        return -1, [str(e)]
 
-# Binary search for problematic section
-def find_failing_range(lines):
+def find_failing_range():
     """Binary search to find the first line range that fails."""
-    total = len(lines)
+    # Per-probe lines are buffered and written once per phase
+    log = []
 
     # Test in chunks of 100 lines
     print("\n--- Testing chunks of 100 lines ---")
-    for start in range(0, total, 100):
-        end = min(start + 100, total)
-        code = ''.join(lines[start:end])
-        wmes, errors = try_parse(code, f"lines {start+1}-{end}")
+    for start, end, wmes, errors in chunk_sweep(100):
         status = "FAIL" if wmes == 0 or errors else "OK"
         if wmes == 0 or errors:
             err_msg = str(errors[0]) if errors else "no errors"
-            print(f"  Lines {start+1:4d}-{end:4d}: {status} (wmes={wmes}, error={err_msg[:50]})")
+            log.append(f"  Lines {start+1:4d}-{end:4d}: {status} (wmes={wmes}, error={err_msg[:50]})")
         else:
-            print(f"  Lines {start+1:4d}-{end:4d}: OK ({wmes} wmes)")
+            log.append(f"  Lines {start+1:4d}-{end:4d}: OK ({wmes} wmes)")
+    sys.stdout.write('\n'.join(log) + '\n')
+    log.clear()
 
-    # Now test cumulative
+    # Now the shortest failing prefix: gallop from the start of the file
+    # until a prefix fails, then bisect that bracket
     print("\n--- Testing cumulative from start ---")
-    for end in [100, 200, 300, 500, 1000, 1500, 2000, 2500, 3000, 3500, total]:
-        if end > total:
-            end = total
-        code = ''.join(lines[:end])
-        wmes, errors = try_parse(code, f"first {end} lines")
-        status = "FAIL" if wmes == 0 or errors else "OK"
+
+    def prefix_fails(end):
+        wmes, errors = parse_prefix(end)
         if wmes == 0 or errors:
             err_msg = errors[0] if errors else "no errors"
-            print(f"  First {end:4d} lines: {status} (wmes={wmes}, error={str(err_msg)[:60]})")
-        else:
-            print(f"  First {end:4d} lines: OK ({wmes} wmes)")
-        if end == total:
-            break
+            log.append(f"  First {end:4d} lines: FAIL (wmes={wmes}, error={str(err_msg)[:60]})")
+            return True
+        log.append(f"  First {end:4d} lines: OK ({wmes} wmes)")
+        return False
+
+    first = binary_search(prefix_fails)
+    sys.stdout.write('\n'.join(log) + '\n')
+    if first is None:
+        print("  All prefixes parse")
+    else:
+        print(f"  Shortest failing prefix: first {first} lines")
+
+
+if __name__ == "__main__":
+    print(f"Total lines: {LINE_COUNT}")
+    print(f"Total bytes: {len(RAW)}")
 
-find_failing_range(lines)
+    find_failing_range()
 
-# Also test the full file again
-print("\n--- Full file test ---")
-code = ''.join(lines)
-wmes, errors = try_parse(code, "full file")
-print(f"Full file: wmes={wmes}, errors={errors}")
+    # Also test the full file again
+    print("\n--- Full file test ---")
+    wmes, errors = full_parse()
+    print(f"Full file: wmes={wmes}, errors={errors}")
@@ -1,70 +1,52 @@
 #!/usr/bin/env python3
-"""Narrow down exact line where exception occurs (2500-3000)."""
+"""Narrow down exact line where exception occurs."""
 import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from reter import Reter
-
-transformer_path = os.path.join(
-    os.path.dirname(__file__),
-    "..", "..", "reter_code", "src", "reter_code", "cadsl", "transformer.py"
+from _debug_transformer_harness import (
+    LINE_COUNT, binary_search, is_exception, line, parse_prefix,
 )
 
-with open(transformer_path, 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-
-def try_parse(code):
-    """Try to parse code and return (wme_count, errors)."""
-    reasoner = Reter()
-    try:
-        wme_count, errors = reasoner.load_python_code(code, "test.py")
-        return wme_count, errors
-    except Exception as e:
-        return -1, [str(e)]
-
-def is_exception(errors):
-    """Check if the error is a C++ exception (not just syntax errors)."""
-    if not errors:
-        return False
-    err = errors[0]
-    if isinstance(err, dict):
-        return err.get('message', '').startswith('Parse failed: ')
-    return 'Parse failed' in str(err)
-
-# Binary search between 2500 and 3000
-print("Binary search between 2500-3000 lines...")
-
-low = 2500
-high = 3000
+# Per-probe lines are buffered and written once per phase
+log = []
 
-while low < high:
-    mid = (low + high) // 2
-    code = ''.join(lines[:mid])
-    wmes, errors = try_parse(code)
-    exception = is_exception(errors)
-
-    print(f"  Lines 1-{mid}: wmes={wmes}, exception={exception}")
-
-    if exception:
-        high = mid
-    else:
-        low = mid + 1
 
-print(f"\nFirst exception at line: {low}")
-
-# Now test the exact line range
-print(f"\nTesting individual lines around {low}...")
-for end in range(low - 10, low + 10):
-    if end < 2500 or end > 3100:
-        continue
-    code = ''.join(lines[:end])
-    wmes, errors = try_parse(code)
+def prefix_fails(mid):
+    wmes, errors = parse_prefix(mid)
     exception = is_exception(errors)
-    status = "EXCEPTION" if exception else ("SYNTAX ERR" if errors else "OK")
-    print(f"  Lines 1-{end}: {status} (wmes={wmes})")
-
-# Print the content around the problem area
-print(f"\n--- Content around line {low} ---")
-for i in range(max(0, low-15), min(len(lines), low+5)):
-    print(f"{i+1:4d}: {lines[i].rstrip()[:80]}")
+    log.append(f"  Lines 1-{mid}: wmes={wmes}, exception={exception}")
+    return exception
+
+
+def main():
+    # Galloping search from the start of the file
+    print("Galloping search for the first failing prefix...")
+
+    low = binary_search(prefix_fails)
+    sys.stdout.write('\n'.join(log) + '\n')
+    log.clear()
+    if low is None:
+        print("\nNo exception: the whole file parses")
+        sys.exit(0)
+
+    print(f"\nFirst exception at line: {low}")
+
+    # Now test the exact line range
+    print(f"\nTesting individual lines around {low}...")
+    for end in range(low - 10, low + 10):
+        if end < 1 or end > LINE_COUNT:
+            continue
+        wmes, errors = parse_prefix(end)
+        exception = is_exception(errors)
+        status = "EXCEPTION" if exception else ("SYNTAX ERR" if errors else "OK")
+        log.append(f"  Lines 1-{end}: {status} (wmes={wmes})")
+    sys.stdout.write('\n'.join(log) + '\n')
+    log.clear()
+
+    # Print the content around the problem area
+    print(f"\n--- Content around line {low} ---")
+    for i in range(max(0, low-15), min(LINE_COUNT, low+5)):
+        print(f"{i+1:4d}: {line(i).rstrip()[:80]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,36 @@
 #!/usr/bin/env python3
 """Debug script to understand why transformer.py fails to parse."""
-import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from _debug_transformer_harness import LINE_COUNT, RAW, TRANSFORMER_PATH
 
 from reter import Reter
 
-transformer_path = os.path.join(
-    os.path.dirname(__file__),
-    "..", "..", "reter_code", "src", "reter_code", "cadsl", "transformer.py"
-)
 
-print(f"Parsing: {transformer_path}")
-print(f"File exists: {os.path.exists(transformer_path)}")
+def main():
+    print(f"Parsing: {TRANSFORMER_PATH}")
+    print(f"File exists: {os.path.exists(TRANSFORMER_PATH)}")
 
-# Get file size and line count
-with open(transformer_path, 'r', encoding='utf-8') as f:
-    content = f.read()
-print(f"File size: {len(content)} bytes")
-print(f"Line count: {len(content.splitlines())}")
+    # Get file size and line count
+    print(f"File size: {len(RAW)} bytes")
+    print(f"Line count: {LINE_COUNT}")
 
-# Try parsing
-reasoner = Reter()
-wme_count, errors = reasoner.load_python_file(transformer_path)
+    # Try parsing the file itself, so the real path and module name are used
+    reasoner = Reter()
+    wme_count, errors = reasoner.load_python_file(TRANSFORMER_PATH)
 
-print(f"\nResult:")
-print(f"  WME count: {wme_count}")
-print(f"  Errors: {len(errors)}")
+    print(f"\nResult:")
+    print(f"  WME count: {wme_count}")
+    print(f"  Errors: {len(errors)}")
 
-if errors:
-    print("\nFirst 20 errors:")
-    for i, err in enumerate(errors[:20]):
-        print(f"  Error {i}: {err}")
+    if errors:
+        print("\nFirst 20 errors:")
+        for i, err in enumerate(errors[:20]):
+            print(f"  Error {i}: {err}")
 
-# Try parsing simple code to verify the parser works
-print("\n\nTesting simple code:")
-simple_code = '''
+    # Try parsing simple code to verify the parser works
+    print("\n\nTesting simple code:")
+    simple_code = '''
 class First:
     def method_a(self):
         pass
@@ -45,7 +40,11 @@ class Second:
         pass
 '''
 
-reasoner2 = Reter()
-wme_count2, errors2 = reasoner2.load_python_code(simple_code, "simple.py")
-print(f"  Simple code WMEs: {wme_count2}")
-print(f"  Simple code errors: {len(errors2)}")
+    reasoner2 = Reter()
+    wme_count2, errors2 = reasoner2.load_python_code(simple_code, "simple.py")
+    print(f"  Simple code WMEs: {wme_count2}")
+    print(f"  Simple code errors: {len(errors2)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Tests for Reter.add_triples (bulk version of add_triple)
+
+Verifies that a bulk load produces exactly the facts that the same triples
+would produce through successive add_triple() calls, including property type
+inference for predicates that are not yet in the network.
+"""
+
+import pytest
+from reter import Reter
+
+
+TRIPLES = [
+    ("Alice", "type", "Person"),
+    ("Alice", "hasAge", "30"),
+    ("Bob", "hasAge", "Unknown"),  # hasAge is already a data property
+    ("Alice", "knows", "Bob"),
+    ("Bob", "knows", "42"),  # knows is already an object property
+    ("Alice", "nickname", '"Ally"'),
+    ("Alice", "sameAs", "Alicia"),
+]
+
+
+def _fact_rows(reasoner):
+    """Facts as sorted (key, value) tuples for order-independent comparison"""
+    table = reasoner.network.get_all_facts_arrow()
+    return sorted(
+        tuple(sorted((key, value) for key, value in row.items() if value is not None))
+        for row in table.to_pylist()
+    )
+
+
+def test_add_triples_matches_add_triple():
+    """Bulk load creates the same facts as one add_triple() call per triple"""
+    sequential = Reter()
+    for triple in TRIPLES:
+        sequential.add_triple(*triple)
+
+    bulk = Reter()
+    fact_ids = bulk.add_triples(TRIPLES)
+
+    assert len(fact_ids) == len(TRIPLES)
+    assert _fact_rows(bulk) == _fact_rows(sequential)
+
+
+def test_add_triples_with_source():
+    """Facts added in bulk are tracked under the given source"""
+    reasoner = Reter()
+    reasoner.add_triples(TRIPLES, source="bulk")
+
+    assert "bulk" in reasoner.get_all_sources()
+
+    reasoner.remove_source("bulk")
+    assert "bulk" not in reasoner.get_all_sources()
+
+
+def test_add_triples_accepts_iterators():
+    """Any iterable of triples works, including generators"""
+    reasoner = Reter()
+    fact_ids = reasoner.add_triples((f"p{i}", "type", "Person") for i in range(5))
+
+    assert len(fact_ids) == 5
+    assert len(reasoner.pattern(("?x", "type", "Person"))) == 5
+
+
+def test_add_triple_property_type_after_source_swap():
+    """A predicate's type follows the current facts, even when the fact count is unchanged"""
+    reasoner = Reter()
+    reasoner.add_triple("Alice", "knows", "Bob", source="people")
+    reasoner.add_triple("Alice", "type", "Person")  # Warms the property type cache
+
+    # Same number of facts afterwards, but knows is now a data property
+    reasoner.remove_source("people")
+    reasoner.add_fact({"type": "data_assertion", "subject": "Carol", "property": "knows", "value": "7"})
+
+    reasoner.add_triple("Dave", "knows", "Erin")
+    dave = [row for row in reasoner.network.get_all_facts_arrow().to_pylist() if row.get("subject") == "Dave"]
+    assert [row["type"] for row in dave] == ["data_assertion"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
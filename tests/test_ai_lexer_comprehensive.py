@@ -881,6 +881,23 @@ class TestAILexerQueries:
         assert 'Alice' in persons
         assert 'Bob' in persons
 
+    def test_dl_query_repeat_after_source_swap(self):
+        """Test that repeated dl_query() calls see the current facts."""
+        reter = Reter(variant='ai')
+        reter.load_ontology("Person(Alice)", source="people")
+
+        first = reter.dl_query("Person")
+        assert first.to_pydict()['?x0'] == ['Alice']
+        # Each call gets its own table
+        assert reter.dl_query("Person") is not first
+
+        # Same fact count, different individual
+        reter.remove_source("people")
+        reter.load_ontology("Person(Bob)", source="people")
+
+        assert reter.dl_query("Person").to_pydict()['?x0'] == ['Bob']
+        assert reter.dl_ask("Person")["result"]
+
     def test_dl_query_intersection(self):
         """Test dl_query() with intersection (and) using AI variant."""
         reter = Reter(variant='ai')
@@ -56,6 +56,12 @@ def test_arrow_optimizations():
     animal_instances = reasoner.get_instances("Animal")
     print(f"Animal instances (should include Fido): {animal_instances}")
 
+    # as_arrow=True returns the same names as an Arrow array
+    dog_array = reasoner.get_instances("Dog", as_arrow=True)
+    print(f"Dog instances (Arrow): {dog_array}")
+    assert dog_array.to_pylist() == dog_instances
+    assert reasoner.get_instances("NoSuchConcept", as_arrow=True).to_pylist() == []
+
     # Test 4: get_subsumers() - should return list
     print("\n=== Test 4: get_subsumers() ===")
     dog_subsumers = reasoner.get_subsumers("Dog")
@@ -88,5 +94,28 @@ def test_arrow_optimizations():
     print("\n=== All tests completed successfully! ===")
 
 
+def test_get_all_facts_is_caller_owned():
+    """Every get_all_facts() call returns its own, current table"""
+    reasoner = Reter()
+    reasoner.load_ontology("Dog（Fido）", source="pets")
+
+    first = reasoner.get_all_facts()
+    assert first is not reasoner.get_all_facts()
+
+    # One caller consuming its table destructively leaves later calls intact
+    try:
+        first.to_pandas(self_destruct=True)
+    except ImportError:
+        pass  # pandas not installed
+    assert reasoner.get_all_facts().num_rows > 0
+
+    # Same fact count, different facts: the table reflects the new content
+    reasoner.remove_source("pets")
+    reasoner.load_ontology("Cat（Whiskers）", source="pets")
+    individuals = reasoner.get_all_facts().column("individual").to_pylist()
+    assert "Whiskers" in individuals and "Fido" not in individuals
+
+
 if __name__ == "__main__":
     test_arrow_optimizations()
+    test_get_all_facts_is_caller_owned()
@@ -299,6 +299,41 @@ def test_query_complex_pattern():
     print("  ✓ Complex pattern works correctly\n")
 
 
+def test_reter_query_non_string_filter():
+    """Test 12: Reter.query() compares non-string filter values with plain equality"""
+    print("=" * 60)
+    print("Test 12: Reter.query() with a non-string filter value")
+    print("=" * 60)
+
+    import pyarrow as pa
+
+    reasoner = Reter()
+    reasoner.load_python_code("class Alpha:\n    def run(self):\n        pass\n", "sample")
+
+    # Pick a value from a non-string fact column (e.g. a line number)
+    table = reasoner.network.get_all_facts_arrow()
+    candidates = [
+        (field.name, value)
+        for field in table.schema
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type))
+        for value in table.column(field.name).to_pylist()
+        if value is not None
+    ]
+    if not candidates:
+        pytest.skip("no non-string fact columns in this build")
+    key, value = candidates[0]
+
+    expected = table.filter(pa.compute.equal(table.column(key), value)).num_rows
+    facts = reasoner.query(**{key: value})
+    print(f"  {key}={value!r}: {len(facts)} facts")
+    assert len(facts) == expected > 0
+    assert all(fact[key] == value for fact in facts)
+
+    # A value no fact field can equal matches nothing instead of raising
+    assert reasoner.query(type='instance_of', individual=42) == []
+    print("  ✓ Non-string filter works correctly\n")
+
+
 def run_all_tests():
     """Run all tests in sequence"""
     print("\n" + "=" * 60)
@@ -317,6 +352,7 @@ def run_all_tests():
         test_query_performance,
         test_query_cache_invalidation,
         test_query_complex_pattern,
+        test_reter_query_non_string_filter,
     ]
 
     passed = 0
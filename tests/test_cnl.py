@@ -4,6 +4,7 @@ Test CNL (Controlled Natural Language) parsing functionality.
 Tests the C++ CNL parser that converts English-like ontology statements
 into RETER facts.
 """
+import collections
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -11,9 +12,26 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import pytest
 try:
     import owl_rete_cpp
-    CNL_AVAILABLE = hasattr(owl_rete_cpp, 'parse_cnl')
 except ImportError:
-    CNL_AVAILABLE = False
+    owl_rete_cpp = None
+
+# Resolve the CNL bindings once; None marks a symbol the build does not expose
+_CNL_SYMBOLS = {
+    name: getattr(owl_rete_cpp, name, None)
+    for name in (
+        'parse_cnl', 'parse_cnl_file', 'load_cnl_from_string', 'validate_cnl',
+        'get_cnl_version', 'CNLParseOptions', 'ReteNetwork',
+    )
+}
+CNL_AVAILABLE = _CNL_SYMBOLS['parse_cnl'] is not None
+
+
+def _by_type(facts):
+    """Group parsed facts by their 'type' in one pass"""
+    by_type = collections.defaultdict(list)
+    for fact in facts:
+        by_type[fact.get('type')].append(fact)
+    return by_type
 
 
 @pytest.mark.skipif(not CNL_AVAILABLE, reason="CNL parser not compiled")
@@ -22,11 +40,8 @@ class TestCNLBasicParsing:
 
     def test_parse_cnl_available(self):
         """Test that CNL functions are exposed"""
-        assert hasattr(owl_rete_cpp, 'parse_cnl')
-        assert hasattr(owl_rete_cpp, 'parse_cnl_file')
-        assert hasattr(owl_rete_cpp, 'load_cnl_from_string')
-        assert hasattr(owl_rete_cpp, 'validate_cnl')
-        assert hasattr(owl_rete_cpp, 'get_cnl_version')
+        missing = [name for name, symbol in _CNL_SYMBOLS.items() if symbol is None]
+        assert not missing, f"Missing CNL symbols: {missing}"
 
     def test_get_cnl_version(self):
         """Test CNL version retrieval"""
@@ -54,7 +69,7 @@ class TestCNLSubsumption:
         assert len(result.facts) >= 1
 
         # Find subsumption fact
-        subsumption_facts = [f for f in result.facts if f.get('type') == 'subsumption']
+        subsumption_facts = _by_type(result.facts)['subsumption']
         assert len(subsumption_facts) >= 1
 
         fact = subsumption_facts[0]
@@ -71,7 +86,7 @@ class TestCNLSubsumption:
         result = owl_rete_cpp.parse_cnl(cnl)
         assert result.success, f"Parse errors: {result.errors}"
 
-        subsumption_facts = [f for f in result.facts if f.get('type') == 'subsumption']
+        subsumption_facts = _by_type(result.facts)['subsumption']
         assert len(subsumption_facts) >= 3
 
     def test_plural_subsumption(self):
@@ -86,7 +101,7 @@ class TestCNLSubsumption:
         result = owl_rete_cpp.parse_cnl("Every domestic-cat is a cat.")
         assert result.success, f"Parse errors: {result.errors}"
 
-        subsumption_facts = [f for f in result.facts if f.get('type') == 'subsumption']
+        subsumption_facts = _by_type(result.facts)['subsumption']
         assert len(subsumption_facts) >= 1
 
 
@@ -101,7 +116,7 @@ class TestCNLEquivalence:
         )
         assert result.success, f"Parse errors: {result.errors}"
 
-        equiv_facts = [f for f in result.facts if f.get('type') == 'equivalence']
+        equiv_facts = _by_type(result.facts)['equivalence']
         assert len(equiv_facts) >= 1
 
 
@@ -115,8 +130,8 @@ class TestCNLDisjoint:
         assert result.success, f"Parse errors: {result.errors}"
 
         # Should produce disjoint class fact
-        disjoint_facts = [f for f in result.facts
-                         if f.get('type') in ('disjoint', 'alldisjoint_classes')]
+        by_type = _by_type(result.facts)
+        disjoint_facts = by_type['disjoint'] + by_type['alldisjoint_classes']
         assert len(disjoint_facts) >= 1
 
 
@@ -129,7 +144,7 @@ class TestCNLInstances:
         result = owl_rete_cpp.parse_cnl("John is a person.")
         assert result.success, f"Parse errors: {result.errors}"
 
-        instance_facts = [f for f in result.facts if f.get('type') == 'instance_of']
+        instance_facts = _by_type(result.facts)['instance_of']
         assert len(instance_facts) >= 1
 
         fact = instance_facts[0]
@@ -141,7 +156,7 @@ class TestCNLInstances:
         result = owl_rete_cpp.parse_cnl("Mary is married-to John.")
         assert result.success, f"Parse errors: {result.errors}"
 
-        role_facts = [f for f in result.facts if f.get('type') == 'role_assertion']
+        role_facts = _by_type(result.facts)['role_assertion']
         assert len(role_facts) >= 1
 
 
@@ -175,7 +190,7 @@ class TestCNLExistential:
         assert result.success, f"Parse errors: {result.errors}"
 
         # Should produce some_values_from restriction
-        svf_facts = [f for f in result.facts if f.get('type') == 'some_values_from']
+        svf_facts = _by_type(result.facts)['some_values_from']
         # Or subsumption to existential restriction
         assert len(result.facts) >= 1
 
@@ -190,7 +205,7 @@ class TestCNLUniversal:
         assert result.success, f"Parse errors: {result.errors}"
 
         # Should produce all_values_from restriction
-        avf_facts = [f for f in result.facts if f.get('type') == 'all_values_from']
+        avf_facts = _by_type(result.facts)['all_values_from']
         assert len(result.facts) >= 1
 
 
@@ -187,6 +187,62 @@ def test_load_python_directory_recursive_finds_nested_files(reter_instance, samp
     assert query_result.num_rows >= 1
 
 
+def test_load_python_directory_follows_symlinked_directories(tmp_path):
+    """
+    Verify that recursive loading descends into symlinked directories and stops at symlink cycles
+    """
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "linked.py").write_text("class Linked:\n    pass\n")
+
+    project = tmp_path / "project"
+    project.mkdir()
+    try:
+        os.symlink(shared, project / "linked_pkg", target_is_directory=True)
+        os.symlink(project, shared / "back", target_is_directory=True)  # Cycle
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported here")
+
+    reter = Reter(variant='ai')
+    wme_count, errors = reter.load_python_directory(str(project), recursive=True)
+
+    assert wme_count > 0  # linked.py is only reachable through the symlink
+    assert errors == {}
+
+
+def test_load_python_directory_parallel_matches_serial(sample_python_directory):
+    """
+    Verify that parsing with worker processes loads the same facts as a serial load
+    """
+    serial = Reter(variant='ai')
+    serial_wmes, serial_errors = serial.load_python_directory(sample_python_directory)
+
+    parallel = Reter(variant='ai')
+    parallel_wmes, parallel_errors = parallel.load_python_directory(sample_python_directory, workers=2)
+
+    assert parallel_wmes == serial_wmes
+    assert parallel_errors == serial_errors
+    assert parallel.network.fact_count() == serial.network.fact_count()
+
+
+def test_load_python_directory_parse_cache(sample_python_directory, tmp_path):
+    """
+    Verify that a load replayed from the parse cache matches a fresh parse
+    """
+    cache_dir = tmp_path / "parse_cache"
+
+    first = Reter(variant='ai')
+    first_wmes, first_errors = first.load_python_directory(sample_python_directory, cache_dir=str(cache_dir))
+    assert any(cache_dir.rglob("*.pickle"))  # Entries were written
+
+    second = Reter(variant='ai')
+    second_wmes, second_errors = second.load_python_directory(sample_python_directory, cache_dir=str(cache_dir))
+
+    assert second_wmes == first_wmes
+    assert second_errors == first_errors
+    assert second.network.fact_count() == first.network.fact_count()
+
+
 def test_load_python_code_with_complex_code(reter_instance):
     """
     Verify that load_python_code handles more complex code structures
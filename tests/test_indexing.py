@@ -153,6 +153,34 @@ def test_empty_slice():
     print("✓ Empty slice test passed")
 
 
+def test_negative_and_stepped_slices():
+    """Test slices with negative bounds and non-unit steps"""
+    print("\n=== Test 5b: Negative and stepped slices ===")
+
+    r = Reter()
+
+    ontology = []
+    for i in range(6):
+        ontology.append(f"Person（person{i}）")
+
+    r.load_ontology("\n".join(ontology))
+
+    results = r.pattern(("?x", "type", "Person"))
+    rows = results.to_list()
+    assert len(rows) == 6
+
+    # Slices must agree with plain list slicing
+    assert results[-2:] == rows[-2:]
+    assert results[:-1] == rows[:-1]
+    assert results[-4:-1] == rows[-4:-1]
+    assert results[1::2] == rows[1::2]
+    assert results[::-1] == rows[::-1]
+    assert results[4:1:-2] == rows[4:1:-2]
+    assert results[-100:100] == rows
+
+    print("✓ Negative and stepped slice test passed")
+
+
 def test_large_result_set():
     """Test indexing with large result sets"""
     print("\n=== Test 6: Large result set ===")
@@ -252,6 +280,90 @@ def test_combined_operations():
     print("✓ Combined operations test passed")
 
 
+def test_iter_batches():
+    """Test batched Arrow iteration matches the full result"""
+    print("\n=== Test 9: iter_batches ===")
+
+    r = Reter()
+
+    ontology = []
+    for i in range(10):
+        ontology.append(f"Person（person{i}）")
+
+    r.load_ontology("\n".join(ontology))
+
+    results = r.pattern(("?x", "type", "Person"))
+    batches = list(results.iter_batches(batch_size=4))
+
+    assert [batch.num_rows for batch in batches] == [4, 4, 2]
+    assert [row for batch in batches for row in batch.to_pylist()] == results.to_list()
+
+    print("✓ iter_batches test passed")
+
+
+def test_conversions_agree():
+    """Test to_list, iter_batches and to_arrow agree for pattern and template results"""
+    print("\n=== Test 10: Conversions agree ===")
+
+    r = Reter()
+    r.load_ontology("""
+        Person（john）
+        Person（mary）
+        hasAge（john，30）
+        hasAge（mary，25）
+    """)
+
+    result_sets = [
+        r.pattern(("?x", "type", "Person"), ("?x", "hasAge", "?age"), select=["?age"]),
+        r.instances_of("Person"),
+    ]
+    for results in result_sets:
+        rows = results.to_list()
+        print(f"{results!r}: {rows}")
+        assert rows == list(results)
+        assert rows == results.to_arrow().to_pylist()
+        assert [row for batch in results.iter_batches(batch_size=1) for row in batch.to_pylist()] == rows
+
+    print("✓ Conversions test passed")
+
+
+def test_iter_batches_shared_schema():
+    """Test every batch gets one schema even when a batch's column is all None"""
+    print("\n=== Test 11: iter_batches with an all-None batch ===")
+
+    import pyarrow as pa
+    from reter.query_result_sets import QueryResultSet
+
+    class BindingsNetwork:
+        """Network stand-in whose tokens are already their bindings"""
+
+        def extract_bindings(self, cache_key, token):
+            return token
+
+    # The first batch of three has no ?email values at all
+    tokens = [
+        {"?x": f"person{i}", "?email": None if i < 3 else f"person{i}@example.com"}
+        for i in range(7)
+    ]
+    results = QueryResultSet("emails", ["?x", "?email"], BindingsNetwork(), tokens=tokens)
+
+    batches = list(results.iter_batches(batch_size=3))
+    print(f"Batch types: {[str(batch.schema.field('?email').type) for batch in batches]}")
+    assert [batch.num_rows for batch in batches] == [3, 3, 1]
+    assert all(batch.schema == batches[0].schema for batch in batches)
+    assert pa.Table.from_batches(batches).to_pylist() == results.to_list()
+
+    # Raw bindings have no variable list to build a schema from
+    raw = QueryResultSet("emails", None, BindingsNetwork(), tokens=tokens)
+    try:
+        next(raw.iter_batches())
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        print(f"✓ Correctly raised ValueError: {e}")
+
+    print("✓ iter_batches shared schema test passed")
+
+
 def run_all_tests():
     """Run all indexing tests"""
     print("=" * 70)
@@ -264,9 +376,13 @@ def run_all_tests():
         test_out_of_bounds,
         test_negative_indexing,
         test_empty_slice,
+        test_negative_and_stepped_slices,
         test_large_result_set,
         test_with_variables,
         test_combined_operations,
+        test_iter_batches,
+        test_conversions_agree,
+        test_iter_batches_shared_schema,
     ]
 
     passed = 0
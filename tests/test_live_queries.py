@@ -344,6 +344,83 @@ def test_live_query_repr():
     print("✓ Repr test passed")
 
 
+def test_live_query_pattern_order():
+    """Test that join results do not depend on the order of the patterns"""
+    print("\n=== Test 11: Pattern order independence ===")
+
+    r = Reter()
+    r.load_ontology("""
+        Person（john）
+        Person（mary）
+        Person（bob）
+        Person（alice）
+        hasAge（john，30）
+    """)
+
+    # Skewed join: many Person facts, a single hasAge fact
+    forward = r.live_pattern(
+        ("?x", "type", "Person"),
+        ("?x", "hasAge", "?age")
+    )
+    backward = r.live_pattern(
+        ("?x", "hasAge", "?age"),
+        ("?x", "type", "Person")
+    )
+
+    assert forward.to_list() == backward.to_list() == [{"?x": "john", "?age": "30"}]
+
+    # Both stay in sync as facts are added
+    r.load_ontology("""
+        hasAge（mary，25）
+    """)
+    forward_rows = sorted(row["?x"] for row in forward.to_list())
+    backward_rows = sorted(row["?x"] for row in backward.to_list())
+    print(f"After update: {forward_rows}")
+    assert forward_rows == backward_rows == ["john", "mary"]
+
+    print("✓ Pattern order test passed")
+
+
+def test_live_query_join_plan():
+    """Test that the selectivity-ordered plan gives the same rows and is reused until facts change"""
+    print("\n=== Test 12: Live query join plan ===")
+
+    r = Reter()
+    r.load_ontology("""
+        Person（john）
+        Person（mary）
+        Person（bob）
+        Person（alice）
+        hasAge（john，30）
+    """)
+
+    patterns = (("?x", "type", "Person"), ("?x", "hasAge", "?age"))
+    expected = r.pattern(*patterns).to_list()
+
+    live = r.live_pattern(*patterns)
+    assert live.to_list() == expected == [{"?x": "john", "?age": "30"}]
+
+    # The single hasAge fact is joined before the four Person facts
+    (plan_key, (_, plan)), = r._live_join_orders.items()
+    print(f"Join order: {plan}")
+    assert list(plan) == [("?x", "hasAge", "?age"), ("?x", "type", "Person")]
+
+    # Same live query again with no changes: the stored plan is reused
+    again = r.live_pattern(*patterns)
+    assert again.to_list() == expected
+    assert r._live_join_orders[plan_key][1] is plan
+
+    # After a change the plan is estimated again, and rows still match pattern()
+    r.add_triple("mary", "hasAge", "25")
+    rebuilt = r.live_pattern(*patterns)
+    assert r._live_join_orders[plan_key][1] is not plan
+    rows = sorted(row["?x"] for row in rebuilt.to_list())
+    print(f"After update: {rows}")
+    assert rows == sorted(row["?x"] for row in r.pattern(*patterns).to_list()) == ["john", "mary"]
+
+    print("✓ Join plan test passed")
+
+
 def run_all_tests():
     """Run all live query tests"""
     print("=" * 70)
@@ -361,6 +438,8 @@ def run_all_tests():
         test_live_query_empty_results,
         test_live_query_variable_selection,
         test_live_query_repr,
+        test_live_query_pattern_order,
+        test_live_query_join_plan,
     ]
 
     passed = 0
@@ -320,6 +320,70 @@ def test_property_path_deep_hierarchy():
     print("✓ Deep hierarchy test passed")
 
 
+def test_property_path_after_source_swap():
+    """Test that a held result set reflects facts replaced via remove_source"""
+    print("\n=== Test 11: Property path after source swap ===")
+
+    r = Reter()
+    r.load_ontology("""
+        hasParent（alice，bob）
+    """, source="family")
+
+    results = r.property_path("alice", "hasParent*", "?ancestor")
+    assert {row["?ancestor"] for row in results} == {"bob"}
+
+    # Same number of facts afterwards, different content
+    r.remove_source("family")
+    r.load_ontology("""
+        hasParent（alice，carol）
+    """, source="family")
+
+    ancestors = {row["?ancestor"] for row in results}
+    print(f"After swap: {ancestors}")
+    assert ancestors == {"carol"}, f"Expected the new parent only, got {ancestors}"
+    assert len(results) == 1
+    assert results.to_arrow().column("?ancestor").to_pylist() == ["carol"]
+
+    # Editing returned rows must not change later reads of the same closure
+    results.to_list()[0]["?ancestor"] = "mallory"
+    for row in results:
+        row["?ancestor"] = "mallory"
+    assert results.to_list() == [{"?ancestor": "carol"}]
+
+    print("✓ Source swap test passed")
+
+
+def test_property_path_order():
+    """Test that rows come out in breadth-first order following the edge order"""
+    print("\n=== Test 12: Property path row order ===")
+
+    r = Reter()
+    facts = []
+    for i in range(10):
+        facts.append(f"hasChild（root，child{i}）")
+        facts.append(f"hasChild（child{i}，grandchild{i}）")
+    r.load_ontology("\n".join(facts))
+
+    # Reference BFS over the edges in the order the network returns them
+    edges = [(edge["?s"], edge["?o"]) for edge in r.pattern(("?s", "hasChild", "?o"))]
+    expected, seen, frontier = [], {"root"}, ["root"]
+    while frontier:
+        next_frontier = []
+        for node in frontier:
+            for source, target in edges:
+                if source == node and target not in seen:
+                    seen.add(target)
+                    expected.append(target)
+                    next_frontier.append(target)
+        frontier = next_frontier
+
+    descendants = [row["?d"] for row in r.property_path("root", "hasChild*", "?d")]
+    print(f"Order: {descendants}")
+    assert descendants == expected, f"Expected {expected}, got {descendants}"
+
+    print("✓ Row order test passed")
+
+
 def run_all_tests():
     """Run all property path tests"""
     print("=" * 70)
@@ -337,6 +401,8 @@ def run_all_tests():
         test_property_path_iteration,
         test_property_path_pandas,
         test_property_path_deep_hierarchy,
+        test_property_path_after_source_swap,
+        test_property_path_order,
     ]
 
     passed = 0